@@ -0,0 +1,53 @@
+"""Grant or revoke admin access to the /admin and /metrics endpoints.
+
+Admin rights are the server-side isAdmin flag on a user, which no API
+request can set. Run this against the database at deploy time:
+
+    python admins.py grant ops@village.com
+    python admins.py revoke ops@village.com
+    python admins.py list
+"""
+import argparse
+import os
+import sys
+
+
+def set_admin(db, email, is_admin):
+    # Returns False when no registered user has that email
+    result = db["users"].update_one({"email": email}, {"$set": {"isAdmin": is_admin}})
+    return result.matched_count > 0
+
+
+def list_admins(db):
+    return [user["email"] for user in db["users"].find({"isAdmin": True}, {"email": 1})]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage Village Jobs administrators")
+    parser.add_argument("action", choices=["grant", "revoke", "list"])
+    parser.add_argument("emails", nargs="*")
+    args = parser.parse_args(argv)
+    if args.action != "list" and not args.emails:
+        parser.error(f"{args.action} needs at least one email")
+
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+
+    load_dotenv()
+    client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    db = client["village_jobs"]
+    try:
+        if args.action == "list":
+            for email in list_admins(db):
+                print(email)
+            return 0
+        missing = [email for email in args.emails if not set_admin(db, email, args.action == "grant")]
+        for email in missing:
+            print(f"No user registered with email {email}", file=sys.stderr)
+        return 1 if missing else 0
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Per-user/per-IP rate limiting and global load shedding as ASGI middleware.
+
+Every request is classified as "auth" (/token, /register), "writes" (POST,
+PUT, PATCH, DELETE) or "reads" and must take a token from both its client
+IP's bucket and, when it carries a valid bearer token, its user's bucket for
+that class; an empty bucket answers 429. Admitted requests then wait for one
+of MAX_CONCURRENT_REQUESTS slots and are shed with 503 once they have queued
+longer than MAX_QUEUE_WAIT_MS. Both responses carry Retry-After.
+
+Buckets and slots live in each worker process, so the configured budgets and
+MAX_CONCURRENT_REQUESTS are totals split evenly between the WEB_CONCURRENCY
+workers, the same way mongo_pool splits MONGO_MAX_CONNECTIONS. Streaming
+exports are rate limited but do not hold a concurrency slot.
+"""
+import asyncio
+import json
+import math
+import os
+import time
+
+import jwt
+
+from mongo_pool import worker_count
+
+AUTH_PATHS = ("/token", "/register")
+WRITE_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+# Default (tokens per second, burst) budgets per route class
+DEFAULT_USER_BUDGETS = {
+    "auth": (0.2, 5),
+    "reads": (10.0, 40),
+    "writes": (2.0, 10),
+}
+# Village clients often share one IP behind a mobile NAT, so IP budgets are looser
+DEFAULT_IP_BUDGETS = {
+    "auth": (0.5, 10),
+    "reads": (30.0, 100),
+    "writes": (10.0, 30),
+}
+
+# Buckets idle long enough to have refilled are dropped once this many keys exist
+MAX_BUCKETS = 100000
+
+
+def parse_budget(value, default):
+    # "rate/burst", e.g. "2/10" for two tokens per second with bursts of ten
+    if not value:
+        return default
+    rate, _, burst = value.partition("/")
+    return float(rate), float(burst or rate)
+
+
+def per_worker(budgets, workers):
+    # A worker sees about 1/workers of a client's requests; keep room for at least one
+    return {
+        route_class: (rate / workers, max(1.0, burst / workers))
+        for route_class, (rate, burst) in budgets.items()
+    }
+
+
+def budgets_from_env(prefix, defaults):
+    return {
+        route_class: parse_budget(os.getenv(f"{prefix}_{route_class.upper()}"), default)
+        for route_class, default in defaults.items()
+    }
+
+
+class TokenBuckets:
+    def __init__(self, budgets, max_keys=MAX_BUCKETS):
+        self.budgets = budgets
+        self.max_keys = max_keys
+        self.buckets = {}
+
+    def take(self, key, route_class, now=None):
+        # Returns 0 when admitted, otherwise the seconds until a token is available
+        rate, burst = self.budgets[route_class]
+        now = time.monotonic() if now is None else now
+        tokens, updated = self.buckets.get((key, route_class), (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+        if tokens >= 1:
+            self.buckets[(key, route_class)] = (tokens - 1, now)
+            if len(self.buckets) > self.max_keys:
+                self.evict(now)
+            return 0.0
+        self.buckets[(key, route_class)] = (tokens, now)
+        return (1 - tokens) / rate if rate > 0 else 60.0
+
+    def evict(self, now):
+        # Full buckets carry no state worth keeping
+        for bucket_key, (tokens, updated) in list(self.buckets.items()):
+            rate, burst = self.budgets[bucket_key[1]]
+            if tokens + (now - updated) * rate >= burst:
+                del self.buckets[bucket_key]
+
+
+class AdmissionControlMiddleware:
+    def __init__(
+        self,
+        app,
+        secret_key,
+        algorithm="HS256",
+        user_budgets=None,
+        ip_budgets=None,
+        max_concurrent=None,
+        max_queue_wait_ms=None,
+        exempt_paths=("/docs", "/openapi.json", "/redoc"),
+        unslotted_prefixes=("/admin/export",),
+        workers=None,
+    ):
+        self.app = app
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        workers = workers or worker_count()
+        self.user_buckets = TokenBuckets(per_worker(
+            user_budgets or budgets_from_env("RATE_LIMIT_USER", DEFAULT_USER_BUDGETS), workers
+        ))
+        self.ip_buckets = TokenBuckets(per_worker(
+            ip_budgets or budgets_from_env("RATE_LIMIT_IP", DEFAULT_IP_BUDGETS), workers
+        ))
+        self.max_concurrent = max(1, (max_concurrent or int(os.getenv("MAX_CONCURRENT_REQUESTS", "64"))) // workers)
+        self.max_queue_wait = (max_queue_wait_ms or int(os.getenv("MAX_QUEUE_WAIT_MS", "500"))) / 1000
+        self.exempt_paths = exempt_paths
+        # Long-lived streams would pin a slot for their whole duration
+        self.unslotted_prefixes = unslotted_prefixes
+        self.slots = None
+
+    def route_class(self, scope):
+        if scope["path"] in AUTH_PATHS:
+            return "auth"
+        if scope["method"] in WRITE_METHODS:
+            return "writes"
+        return "reads"
+
+    def user_key(self, scope):
+        # Identify the user from the bearer token without a database lookup
+        for name, value in scope.get("headers", ()):
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() != "bearer" or not token:
+                    return None
+                try:
+                    return jwt.decode(token, self.secret_key, algorithms=[self.algorithm]).get("sub")
+                except jwt.PyJWTError:
+                    return None
+        return None
+
+    async def reject(self, send, status_code, detail, retry_after):
+        body = json.dumps({"detail": detail}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] == "OPTIONS" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.route_class(scope)
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        wait = self.ip_buckets.take(ip, route_class)
+        user = self.user_key(scope) if not wait else None
+        if not wait and user:
+            wait = self.user_buckets.take(user, route_class)
+        if wait:
+            await self.reject(send, 429, "Too many requests", wait)
+            return
+        if scope["path"].startswith(self.unslotted_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        # Created lazily so the semaphore binds to the running event loop
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.max_concurrent)
+        try:
+            await asyncio.wait_for(self.slots.acquire(), timeout=self.max_queue_wait)
+        except asyncio.TimeoutError:
+            await self.reject(send, 503, "Server is overloaded, please retry", 1)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.slots.release()
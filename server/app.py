@@ -1,21 +1,70 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, status, File, UploadFile, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import List, Literal, Optional
+from contextlib import asynccontextmanager
+import codecs
+import csv
+import json
+import re
+import logging
+import random
+import threading
+from datetime import datetime, timedelta, timezone
+import asyncio
 from bson import ObjectId
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError, DuplicateKeyError, PyMongoError
 import jwt
 import bcrypt
-from pydantic import BaseModel, Field, EmailStr
+from pydantic import BaseModel, Field, EmailStr, TypeAdapter, ValidationError
 import os
 from dotenv import load_dotenv
+from mongo_pool import PoolMetrics, pool_options
+from admission import AdmissionControlMiddleware
+from negotiation import ContentNegotiationMiddleware
+from coalesce import SingleFlight
+from facets import FACET_FIELDS, FIELD_KINDS, FacetCounts, PrefixTrie
+from tracing import MongoCommandTracer, TracingMiddleware, tracer
+
+# NumPy ranking, export and seed code is imported inside the routes that use
+# it, so a serverless cold start only pays for what the request needs.
+
+logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 
+# JWT Configuration
+SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key")
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
+
+@asynccontextmanager
+async def lifespan(app):
+    sweeper = None
+    # Serverless instances are short-lived; POST /admin/jobs/expire covers them instead
+    if os.getenv("JOB_EXPIRY_SWEEPER", "off" if os.getenv("VERCEL") else "on") != "off":
+        sweeper = asyncio.create_task(run_job_expiry_sweeper())
+    yield
+    if sweeper is not None:
+        sweeper.cancel()
+    # Close pooled connections on shutdown
+    close_client()
+
 # Initialize FastAPI app
-app = FastAPI(title="Village Jobs API")
+app = FastAPI(title="Village Jobs API", lifespan=lifespan)
+
+# Compress large JSON responses and serve MessagePack on request
+app.add_middleware(
+    ContentNegotiationMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+)
+
+# Rate limit per user/IP and shed load; added before CORS so rejections still get CORS headers
+if os.getenv("ADMISSION_CONTROL", "on") != "off":
+    app.add_middleware(AdmissionControlMiddleware, secret_key=SECRET_KEY, algorithm=ALGORITHM)
 
 # Configure CORS
 app.add_middleware(
@@ -26,21 +75,73 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# MongoDB connection
+# Trace a sample of requests end to end (TRACE_SAMPLE_RATE); outermost so the root span covers every layer
+if tracer.enabled:
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+
+# MongoDB connection, created on first use and reused across warm invocations
 MONGO_URI = os.getenv("MONGO_URI", "mongodb://localhost:27017")
-client = MongoClient(MONGO_URI)
-db = client["village_jobs"]
+DATABASE_NAME = "village_jobs"
+client = None
+client_lock = threading.Lock()
+pool_metrics = PoolMetrics()
+
+def get_client():
+    global client
+    if client is None:
+        with client_lock:
+            if client is None:
+                # Pool limits are per worker process, see mongo_pool.pool_options
+                listeners = [pool_metrics]
+                if tracer.enabled:
+                    listeners.append(MongoCommandTracer(tracer))
+                client = MongoClient(MONGO_URI, event_listeners=listeners, **pool_options())
+                # Build indexes off the request path so the first request does not wait on them
+                threading.Thread(target=ensure_indexes, daemon=True).start()
+    return client
+
+def get_database():
+    return get_client()[DATABASE_NAME]
+
+def close_client():
+    global client
+    with client_lock:
+        if client is not None:
+            client.close()
+            client = None
+
+class LazyCollection:
+    # Stands in for a collection until first use, so importing the app never touches the network
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attr):
+        return getattr(get_database()[self.name], attr)
 
 # Collections
-users_collection = db["users"]
-jobs_collection = db["jobs"]
-applications_collection = db["applications"]
-notifications_collection = db["notifications"]
+users_collection = LazyCollection("users")
+jobs_collection = LazyCollection("jobs")
+applications_collection = LazyCollection("applications")
+notifications_collection = LazyCollection("notifications")
 
-# JWT Configuration
-SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key")
-ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24  # 24 hours
+# Indexes backing the hot queries and dashboard aggregations
+def ensure_indexes():
+    try:
+        jobs_collection.create_index([("providerId", ASCENDING), ("createdAt", DESCENDING)])
+        applications_collection.create_index([("jobId", ASCENDING), ("appliedAt", DESCENDING)])
+        applications_collection.create_index([("seekerId", ASCENDING), ("appliedAt", DESCENDING)])
+        jobs_collection.create_index([("status", ASCENDING), ("requiredSkills", ASCENDING)])
+        notifications_collection.create_index([("userId", ASCENDING), ("read", ASCENDING)])
+        jobs_collection.create_index([("assignedTo", ASCENDING), ("status", ASCENDING)])
+        jobs_collection.create_index([("status", ASCENDING), ("expiresAt", ASCENDING)])
+        jobs_collection.create_index([("status", ASCENDING), ("createdAt", ASCENDING)])
+        # Let the autocomplete rebuild read distinct user locations and skills from indexes
+        users_collection.create_index([("location", ASCENDING)])
+        users_collection.create_index([("skills", ASCENDING)])
+        # Last, since it fails on existing duplicate emails; register and update also check
+        users_collection.create_index([("email", ASCENDING)], unique=True)
+    except PyMongoError:
+        logger.exception("Failed to create indexes")
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
@@ -63,7 +164,8 @@ class TokenData(BaseModel):
 class UserBase(BaseModel):
     name: str
     email: EmailStr
-    userType: str
+    # Clients pick one of these; admin access is the server-side isAdmin flag (see admins.py)
+    userType: Literal["provider", "seeker"]
     location: str
     bio: str
     skills: Optional[List[str]] = []
@@ -74,6 +176,7 @@ class UserCreate(UserBase):
     password: str
 
 class UserResponse(UserBase):
+    userType: str
     id: str
     createdAt: datetime
 
@@ -85,6 +188,7 @@ class JobBase(BaseModel):
     requiredSkills: List[str]
     payment: str
     duration: str
+    expiresAt: Optional[datetime] = None
 
 class JobCreate(JobBase):
     pass
@@ -99,6 +203,19 @@ class JobResponse(JobBase):
     assignedTo: Optional[str] = None
     completedAt: Optional[datetime] = None
 
+class BulkJobRowResult(BaseModel):
+    row: int
+    status: str
+    id: Optional[str] = None
+    title: Optional[str] = None
+    error: Optional[str] = None
+
+class BulkJobImportResponse(BaseModel):
+    created: int = 0
+    failed: int = 0
+    notifiedSeekers: int = 0
+    results: List[BulkJobRowResult]
+
 class ApplicationBase(BaseModel):
     jobId: str
     seekerId: str
@@ -114,6 +231,29 @@ class ApplicationResponse(ApplicationBase):
     seekerProfile: dict
     feedback: Optional[dict] = None
 
+class RankedApplicationResponse(ApplicationResponse):
+    score: Optional[float] = None
+    scoreBreakdown: Optional[dict] = None
+
+class RecommendedJobResponse(JobResponse):
+    score: float
+    scoreBreakdown: dict
+
+class FacetValue(BaseModel):
+    value: str
+    count: int
+
+class JobFacetsResponse(BaseModel):
+    totalOpenJobs: int
+    location: List[FacetValue]
+    category: List[FacetValue]
+    requiredSkills: List[FacetValue]
+
+class AutocompleteSuggestion(BaseModel):
+    value: str
+    kind: str
+    count: int
+
 class NotificationBase(BaseModel):
     userId: str
     type: str
@@ -128,12 +268,320 @@ class NotificationResponse(NotificationBase):
     read: bool = False
     timestamp: datetime
 
+class ProviderDashboardJob(JobResponse):
+    applicationCounts: dict = {}
+    recentApplicants: List[ApplicationResponse] = []
+    averageRating: Optional[float] = None
+    ratingsCount: int = 0
+
+class ProviderDashboardStats(BaseModel):
+    totalJobs: int = 0
+    jobsByStatus: dict = {}
+    totalApplications: int = 0
+    applicationsByStatus: dict = {}
+    completionRate: float = 0.0
+    averageRating: Optional[float] = None
+    ratingsCount: int = 0
+
+class ProviderDashboardResponse(BaseModel):
+    jobs: List[ProviderDashboardJob]
+    stats: ProviderDashboardStats
+
+class JobSummary(BaseModel):
+    id: str
+    title: str
+    location: str
+    category: str
+    payment: str
+    duration: str
+    status: str
+    providerName: str
+
+class SeekerDashboardApplication(ApplicationResponse):
+    job: Optional[JobSummary] = None
+
+class SeekerDashboardResponse(BaseModel):
+    applications: List[SeekerDashboardApplication]
+    matchingJobs: List[JobResponse]
+    unreadNotifications: int = 0
+
+# Number of newest applicants embedded per job on the provider dashboard
+DASHBOARD_RECENT_APPLICANTS = 5
+
+# Number of matching open jobs suggested on the seeker dashboard
+DASHBOARD_MATCHING_JOBS = 10
+
+# Fields of a job embedded in seeker dashboard entries
+JOB_SUMMARY_PROJECTION = {
+    "title": 1,
+    "location": 1,
+    "category": 1,
+    "payment": 1,
+    "duration": 1,
+    "status": 1,
+    "providerName": 1
+}
+
+# In-process feature arrays of open jobs used to rank recommendations.
+# Updated in place when this process changes a job and rebuilt periodically
+# in a worker thread to pick up changes made by other workers.
+JOB_INDEX_REFRESH_SECONDS = int(os.getenv("JOB_INDEX_REFRESH_SECONDS", "60"))
+JOB_FEATURE_PROJECTION = {
+    "requiredSkills": 1,
+    "createdAt": 1,
+    "location": 1,
+    "category": 1,
+    "providerId": 1
+}
+EPOCH = datetime(1970, 1, 1)
+job_feature_index = None
+job_feature_index_built_at = None
+job_feature_index_refresh = None
+
+def upsert_job_features(index, job, provider_rating):
+    index.upsert(
+        str(job["_id"]),
+        job.get("requiredSkills", []),
+        (job["createdAt"] - EPOCH).total_seconds(),
+        job.get("location", ""),
+        job.get("category", ""),
+        job["providerId"],
+        provider_rating
+    )
+
+def index_open_job(job, provider_rating):
+    # Nothing to update until the first recommendation request builds the index
+    if job_feature_index is not None:
+        upsert_job_features(job_feature_index, job, provider_rating)
+
+def unindex_job(job_id):
+    if job_feature_index is not None:
+        job_feature_index.remove(job_id)
+
+def update_indexed_provider_rating(provider_id, rating):
+    if job_feature_index is not None:
+        job_feature_index.set_provider_rating(provider_id, rating)
+
+def build_job_feature_index():
+    # Builds a new index without touching the one being served, so it can run in a thread
+    from ranking import JobFeatureIndex
+    
+    jobs = list(jobs_collection.find({"status": "open"}, JOB_FEATURE_PROJECTION))
+    provider_ids = {job["providerId"] for job in jobs}
+    ratings = {
+        str(provider["_id"]): provider.get("rating", 0.0)
+        for provider in users_collection.find(
+            {"_id": {"$in": [ObjectId(provider_id) for provider_id in provider_ids]}},
+            {"rating": 1}
+        )
+    }
+    index = JobFeatureIndex(capacity=max(256, 2 * len(jobs)))
+    for job in jobs:
+        upsert_job_features(index, job, ratings.get(job["providerId"], 0.0))
+    return index
+
+async def refresh_job_feature_index():
+    global job_feature_index, job_feature_index_built_at, job_feature_index_refresh
+    try:
+        index = await asyncio.to_thread(build_job_feature_index)
+        # Local changes made during the build are picked up again by the next refresh;
+        # recommendations re-check job status when they load the jobs
+        job_feature_index = index
+        job_feature_index_built_at = datetime.utcnow()
+    except PyMongoError:
+        if job_feature_index is None:
+            raise
+        logger.exception("Failed to refresh the job feature index")
+    finally:
+        job_feature_index_refresh = None
+
+async def get_job_feature_index():
+    global job_feature_index_refresh
+    if job_feature_index_refresh is None and (
+        job_feature_index_built_at is None
+        or datetime.utcnow() - job_feature_index_built_at > timedelta(seconds=JOB_INDEX_REFRESH_SECONDS)
+    ):
+        job_feature_index_refresh = asyncio.create_task(refresh_job_feature_index())
+    if job_feature_index is None:
+        # Only the first build is waited for; later refreshes keep serving the current index
+        await asyncio.shield(job_feature_index_refresh)
+    return job_feature_index
+
+# Shares one in-flight query and one serialized response between identical concurrent reads
+single_flight = SingleFlight()
+job_list_adapter = TypeAdapter(List[JobResponse])
+
+def fetch_jobs_json(query):
+    jobs = [serialize_id(job) for job in jobs_collection.find(query)]
+    # Validate like response_model would, dropping internal fields before encoding
+    with tracer.span("serialize.jobs", count=len(jobs)):
+        return job_list_adapter.dump_json(job_list_adapter.validate_python(jobs))
+
+# Open-job facet counts and the autocomplete trie, kept current the same way
+# as the feature index: in place on local job changes, rebuilt periodically
+# in a worker thread
+FACETS_REFRESH_SECONDS = int(os.getenv("FACETS_REFRESH_SECONDS", "300"))
+job_facets = None
+autocomplete_trie = None
+job_facets_built_at = None
+job_facets_refresh = None
+
+def build_job_facets():
+    # Builds new counts and a new trie without touching the ones being served
+    facets = FacetCounts()
+    result = next(jobs_collection.aggregate([
+        {"$match": {"status": "open"}},
+        {"$facet": {
+            "total": [{"$count": "count"}],
+            "location": [{"$group": {"_id": "$location", "count": {"$sum": 1}}}],
+            "category": [{"$group": {"_id": "$category", "count": {"$sum": 1}}}],
+            "requiredSkills": [
+                # Deduplicate within each job so a repeated skill still counts the job once
+                {"$project": {"requiredSkills": {"$setUnion": ["$requiredSkills", []]}}},
+                {"$unwind": "$requiredSkills"},
+                {"$group": {"_id": "$requiredSkills", "count": {"$sum": 1}}}
+            ]
+        }}
+    ]), {})
+    facets.total = (result.get("total") or [{}])[0].get("count", 0)
+    for field in FACET_FIELDS:
+        facets.load(field, [(entry["_id"], entry["count"]) for entry in result.get(field, [])])
+    
+    # Open-job terms come from the facets above, weighted by how many open jobs use them;
+    # user locations and skills are suggested too, read from their indexes
+    trie = PrefixTrie()
+    known_terms = [
+        ("location", users_collection.distinct("location")),
+        ("skill", users_collection.distinct("skills")),
+    ]
+    for kind, terms in known_terms:
+        for term in terms:
+            if isinstance(term, str):
+                trie.insert(term, kind, 0)
+    for field in FACET_FIELDS:
+        for value, count in facets.counts[field].items():
+            trie.insert(value, FIELD_KINDS[field], count)
+    return facets, trie
+
+async def refresh_job_facets():
+    global job_facets, autocomplete_trie, job_facets_built_at, job_facets_refresh
+    try:
+        facets, trie = await asyncio.to_thread(build_job_facets)
+        # Local changes made during the build are picked up again by the next refresh
+        job_facets, autocomplete_trie = facets, trie
+        job_facets_built_at = datetime.utcnow()
+    except PyMongoError:
+        if job_facets is None:
+            raise
+        logger.exception("Failed to refresh job facets")
+    finally:
+        job_facets_refresh = None
+
+async def get_job_facets():
+    global job_facets_refresh
+    if job_facets_refresh is None and (
+        job_facets_built_at is None
+        or datetime.utcnow() - job_facets_built_at > timedelta(seconds=FACETS_REFRESH_SECONDS)
+    ):
+        job_facets_refresh = asyncio.create_task(refresh_job_facets())
+    if job_facets is None:
+        # Only the first build is waited for; later refreshes keep serving the current counts
+        await asyncio.shield(job_facets_refresh)
+    return job_facets, autocomplete_trie
+
+def update_job_facets(job, delta):
+    if job_facets is None:
+        return
+    job_facets.add(job, delta)
+    for field in FACET_FIELDS:
+        for value in job_facets.values(job, field):
+            autocomplete_trie.add(value, FIELD_KINDS[field], delta)
+
+def job_opened(job, provider_rating):
+    index_open_job(job, provider_rating)
+    update_job_facets(job, 1)
+
+def job_closed(job):
+    unindex_job(str(job["_id"]))
+    update_job_facets(job, -1)
+
+# Open jobs expire after this many days unless the provider sets expiresAt
+JOB_DEFAULT_TTL_DAYS = int(os.getenv("JOB_DEFAULT_TTL_DAYS", "30"))
+JOB_EXPIRY_SWEEP_SECONDS = int(os.getenv("JOB_EXPIRY_SWEEP_SECONDS", "300"))
+JOB_EXPIRY_BATCH_SIZE = 500
+
+def job_expiry(expires_at, created_at):
+    # Stored as naive UTC like every other timestamp in the database
+    if expires_at is None:
+        return created_at + timedelta(days=JOB_DEFAULT_TTL_DAYS)
+    if expires_at.tzinfo is not None:
+        expires_at = expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+    if expires_at <= created_at:
+        raise ValueError("expiresAt must be in the future")
+    return expires_at
+
+def expire_stale_jobs(batch_size=JOB_EXPIRY_BATCH_SIZE):
+    # Returns the closed jobs; callers pass them to job_closed on the event loop,
+    # since the in-process indexes are not safe to change from a worker thread.
+    # Jobs posted before expiresAt existed fall back to the default policy
+    now = datetime.utcnow()
+    stale = {
+        "status": "open",
+        "$or": [
+            {"expiresAt": {"$lte": now}},
+            {"expiresAt": None, "createdAt": {"$lte": now - timedelta(days=JOB_DEFAULT_TTL_DAYS)}}
+        ]
+    }
+    closed = []
+    while True:
+        ids = [job["_id"] for job in jobs_collection.find(stale, {"_id": 1}).limit(batch_size)]
+        if not ids:
+            return closed
+        
+        # Claim the batch with a run id so concurrent sweepers never notify twice
+        run_id = ObjectId()
+        jobs_collection.update_many(
+            {"_id": {"$in": ids}, "status": "open"},
+            {"$set": {"status": "expired", "expiredAt": now, "expiryRun": run_id}}
+        )
+        jobs = list(jobs_collection.find({"_id": {"$in": ids}, "expiryRun": run_id}))
+        notifications = []
+        for job in jobs:
+            closed.append({field: job.get(field) for field in ("_id", *FACET_FIELDS)})
+            notifications.append({
+                "userId": job["providerId"],
+                "type": "job-expired",
+                "title": "Job Expired",
+                "message": f"Your job posting has expired and was closed: {job['title']}",
+                "read": False,
+                "timestamp": now
+            })
+        if notifications:
+            notifications_collection.insert_many(notifications, ordered=False)
+
+async def run_job_expiry_sweeper():
+    # Wait before the first sweep so startup never touches Mongo, with jitter
+    # so workers started together do not all sweep at the same moment
+    await asyncio.sleep(JOB_EXPIRY_SWEEP_SECONDS * random.uniform(0.5, 1.5))
+    while True:
+        try:
+            closed = await asyncio.to_thread(expire_stale_jobs)
+            for job in closed:
+                job_closed(job)
+            if closed:
+                logger.info("Expired %d stale jobs", len(closed))
+        except PyMongoError:
+            logger.exception("Job expiry sweep failed")
+        await asyncio.sleep(JOB_EXPIRY_SWEEP_SECONDS)
+
 # Authentication functions
 def verify_password(plain_password, hashed_password):
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password)
+    with tracer.span("bcrypt.checkpw"):
+        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password)
 
 def get_password_hash(password):
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+    with tracer.span("bcrypt.hashpw"):
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
 
 def authenticate_user(email: str, password: str):
     user = users_collection.find_one({"email": email})
@@ -172,6 +620,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
         raise credentials_exception
     return serialize_id(user)
 
+async def get_current_admin(current_user: dict = Depends(get_current_user)):
+    # Set only from the admins.py CLI, never from a request body
+    if current_user.get("isAdmin") is not True:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only administrators can access this endpoint"
+        )
+    return current_user
+
 # Routes
 @app.post("/token", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends()):
@@ -203,8 +660,14 @@ async def register_user(user: UserCreate):
     user_dict["password"] = hashed_password
     user_dict["createdAt"] = datetime.utcnow()
     
-    # Insert into database
-    result = users_collection.insert_one(user_dict)
+    # Insert into database; the unique email index catches concurrent registrations
+    try:
+        result = users_collection.insert_one(user_dict)
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     # Return user without password
     created_user = users_collection.find_one({"_id": result.inserted_id})
@@ -219,12 +682,25 @@ async def update_user(
     user_update: UserBase,
     current_user: dict = Depends(get_current_user)
 ):
+    # Another account's email cannot be taken over
+    if user_update.email != current_user["email"] and users_collection.find_one({"email": user_update.email}):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    
     # Update user
     user_dict = user_update.dict(exclude_unset=True)
-    users_collection.update_one(
-        {"_id": ObjectId(current_user["id"])},
-        {"$set": user_dict}
-    )
+    try:
+        users_collection.update_one(
+            {"_id": ObjectId(current_user["id"])},
+            {"$set": user_dict}
+        )
+    except DuplicateKeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
     
     # Return updated user
     updated_user = users_collection.find_one({"_id": ObjectId(current_user["id"])})
@@ -249,9 +725,17 @@ async def create_job(
     job_dict["status"] = "open"
     job_dict["createdAt"] = datetime.utcnow()
     job_dict["applicants"] = 0
+    try:
+        job_dict["expiresAt"] = job_expiry(job.expiresAt, job_dict["createdAt"])
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
     # Insert into database
     result = jobs_collection.insert_one(job_dict)
+    job_opened(job_dict, current_user.get("rating", 0.0))
     
     # Create notifications for matching job seekers
     matching_users = users_collection.find({
@@ -274,6 +758,186 @@ async def create_job(
     created_job = jobs_collection.find_one({"_id": result.inserted_id})
     return serialize_id(created_job)
 
+# Bulk job import limits
+BULK_IMPORT_BATCH_SIZE = 500
+BULK_IMPORT_MAX_ROWS = 5000
+SKILL_SEPARATORS = re.compile(r"[;|,]")
+
+def parse_bulk_rows(upload: UploadFile, format: Optional[str]):
+    # Yield (row number, raw row dict or parse error) while streaming the upload
+    if not format:
+        filename = (upload.filename or "").lower()
+        content_type = upload.content_type or ""
+        if filename.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type or "jsonl" in content_type:
+            format = "ndjson"
+        else:
+            format = "csv"
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported format, use 'csv' or 'ndjson'"
+        )
+    lines = codecs.iterdecode(upload.file, "utf-8-sig")
+    line_number = 0
+    try:
+        if format == "csv":
+            reader = csv.DictReader(lines)
+            for row in reader:
+                line_number = reader.line_num
+                if not any((value or "").strip() for value in row.values()):
+                    continue
+                # Empty or missing cells are left out so JobCreate reports them as missing
+                row = {
+                    key.strip(): value.strip() for key, value in row.items()
+                    if key and isinstance(value, str) and (value.strip() or key.strip() == "requiredSkills")
+                }
+                if "requiredSkills" in row:
+                    row["requiredSkills"] = [
+                        skill.strip() for skill in SKILL_SEPARATORS.split(row["requiredSkills"]) if skill.strip()
+                    ]
+                yield line_number, row
+        else:
+            for line_number, line in enumerate(lines, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, ValueError(f"Invalid JSON: {e.msg}")
+    except (UnicodeDecodeError, csv.Error) as e:
+        # The reader cannot resume after undecodable or malformed input, so the rest is skipped
+        yield line_number + 1, ValueError(f"Unreadable input, remaining rows skipped: {e}")
+
+def notify_matching_seekers_bulk(jobs):
+    # One seeker query and one batched insert for a whole set of new jobs
+    skills = {skill for job in jobs for skill in job["requiredSkills"]}
+    if not skills:
+        return 0
+    # Positions of the jobs needing each skill, so a seeker only visits jobs they match
+    jobs_by_skill = {}
+    for position, job in enumerate(jobs):
+        for skill in set(job["requiredSkills"]):
+            jobs_by_skill.setdefault(skill, []).append(position)
+    notifications = []
+    notified = 0
+    now = datetime.utcnow()
+    for user in users_collection.find(
+        {"userType": "seeker", "skills": {"$in": list(skills)}},
+        {"skills": 1}
+    ):
+        positions = set()
+        for skill in set(user.get("skills") or []):
+            positions.update(jobs_by_skill.get(skill, ()))
+        titles = [jobs[position]["title"] for position in sorted(positions)]
+        if not titles:
+            continue
+        if len(titles) == 1:
+            message = f"A new job matching your skills has been posted: {titles[0]}"
+        else:
+            shown = ", ".join(titles[:3])
+            more = f" and {len(titles) - 3} more" if len(titles) > 3 else ""
+            message = f"{len(titles)} new jobs matching your skills have been posted: {shown}{more}"
+        notifications.append({
+            "userId": str(user["_id"]),
+            "type": "new-matching-job",
+            "title": "New Job Match",
+            "message": message,
+            "read": False,
+            "timestamp": now
+        })
+        notified += 1
+        if len(notifications) >= BULK_IMPORT_BATCH_SIZE:
+            notifications_collection.insert_many(notifications, ordered=False)
+            notifications = []
+    if notifications:
+        notifications_collection.insert_many(notifications, ordered=False)
+    return notified
+
+@app.post("/jobs/bulk", response_model=BulkJobImportResponse)
+async def bulk_create_jobs(
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    # Check if user is a provider
+    if current_user["userType"] != "provider":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only job providers can create jobs"
+        )
+    
+    results = []
+    created_jobs = []
+    batch = []
+    
+    def flush():
+        # Insert the pending batch; ordered=False lets the rest land if one document fails
+        if not batch:
+            return
+        documents = [job_dict for _, job_dict in batch]
+        write_errors = {}
+        try:
+            jobs_collection.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            write_errors = {error["index"]: error.get("errmsg", "Insert failed") for error in e.details.get("writeErrors", [])}
+            if not write_errors:
+                raise
+        for index, (row, job_dict) in enumerate(batch):
+            if index in write_errors:
+                results.append({"row": row, "status": "error", "error": write_errors[index]})
+                continue
+            results.append({"row": row, "status": "created", "id": str(job_dict["_id"]), "title": job_dict["title"]})
+            job_opened(job_dict, current_user.get("rating", 0.0))
+            created_jobs.append(job_dict)
+        batch.clear()
+    
+    rows = 0
+    for row, data in parse_bulk_rows(file, format):
+        rows += 1
+        if rows > BULK_IMPORT_MAX_ROWS:
+            results.append({"row": row, "status": "error", "error": f"Row limit of {BULK_IMPORT_MAX_ROWS} exceeded"})
+            break
+        if isinstance(data, Exception):
+            results.append({"row": row, "status": "error", "error": str(data)})
+            continue
+        if not isinstance(data, dict):
+            results.append({"row": row, "status": "error", "error": "Row must be an object"})
+            continue
+        try:
+            job = JobCreate(**data)
+        except ValidationError as e:
+            error = "; ".join(
+                f"{'.'.join(str(part) for part in err['loc'])}: {err['msg']}" for err in e.errors()
+            )
+            results.append({"row": row, "status": "error", "error": error})
+            continue
+        
+        job_dict = job.dict()
+        job_dict["_id"] = ObjectId()
+        job_dict["providerId"] = current_user["id"]
+        job_dict["providerName"] = current_user["name"]
+        job_dict["status"] = "open"
+        job_dict["createdAt"] = datetime.utcnow()
+        job_dict["applicants"] = 0
+        try:
+            job_dict["expiresAt"] = job_expiry(job.expiresAt, job_dict["createdAt"])
+        except ValueError as e:
+            results.append({"row": row, "status": "error", "error": str(e)})
+            continue
+        batch.append((row, job_dict))
+        if len(batch) >= BULK_IMPORT_BATCH_SIZE:
+            flush()
+    flush()
+    
+    notified = notify_matching_seekers_bulk(created_jobs) if created_jobs else 0
+    results.sort(key=lambda result: result["row"])
+    return {
+        "created": len(created_jobs),
+        "failed": sum(1 for result in results if result["status"] == "error"),
+        "notifiedSeekers": notified,
+        "results": results
+    }
+
 @app.get("/jobs", response_model=List[JobResponse])
 async def get_jobs(
     status: Optional[str] = None,
@@ -290,9 +954,9 @@ async def get_jobs(
     if category:
         query["category"] = category
     
-    # Get jobs
-    jobs = list(jobs_collection.find(query))
-    return [serialize_id(job) for job in jobs]
+    # Get jobs, joining any identical query already in flight
+    body = await single_flight.do("jobs", tuple(sorted(query.items())), fetch_jobs_json, query)
+    return Response(content=body, media_type="application/json")
 
 @app.get("/jobs/provider", response_model=List[JobResponse])
 async def get_provider_jobs(
@@ -320,12 +984,102 @@ async def get_matching_jobs(
             detail="Only job seekers can access this endpoint"
         )
     
-    # Get matching jobs
-    jobs = list(jobs_collection.find({
+    # Get matching jobs; seekers with the same skill set share one query
+    skills = sorted(set(current_user["skills"]))
+    query = {
         "status": "open",
-        "requiredSkills": {"$in": current_user["skills"]}
-    }))
-    return [serialize_id(job) for job in jobs]
+        "requiredSkills": {"$in": skills}
+    }
+    body = await single_flight.do("jobs.matching", tuple(skills), fetch_jobs_json, query)
+    return Response(content=body, media_type="application/json")
+
+@app.get("/jobs/facets", response_model=JobFacetsResponse)
+async def get_job_facets_counts(
+    limit: Optional[int] = None,
+    current_user: dict = Depends(get_current_user)
+):
+    # Open-job counts per filter value, served from memory
+    facets, _ = await get_job_facets()
+    return {"totalOpenJobs": facets.total, **facets.snapshot(limit)}
+
+@app.get("/autocomplete", response_model=List[AutocompleteSuggestion])
+async def autocomplete(
+    prefix: str,
+    kind: Optional[str] = None,
+    limit: int = 10,
+    current_user: dict = Depends(get_current_user)
+):
+    if kind is not None and kind not in FIELD_KINDS.values():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported kind, use 'location', 'category' or 'skill'"
+        )
+    _, trie = await get_job_facets()
+    return trie.complete(prefix, max(1, min(limit, 50)), {kind} if kind else None)
+
+@app.get("/jobs/recommended", response_model=List[RecommendedJobResponse])
+async def get_recommended_jobs(
+    k: int = 20,
+    current_user: dict = Depends(get_current_user)
+):
+    # Check if user is a seeker
+    if current_user["userType"] != "seeker":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only job seekers can access this endpoint"
+        )
+    if k <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="k must be a positive integer"
+        )
+    k = min(k, 100)
+    
+    # Seeker history: jobs already applied for and categories of past assignments
+    applied = {
+        application["jobId"]
+        for application in applications_collection.find({"seekerId": current_user["id"]}, {"jobId": 1})
+    }
+    category_counts = {
+        entry["_id"]: entry["count"]
+        for entry in jobs_collection.aggregate([
+            {"$match": {"assignedTo": current_user["id"]}},
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}}
+        ])
+        if entry["_id"]
+    }
+    
+    # Rank every open job in one vectorized pass
+    job_ids, scores, components = (await get_job_feature_index()).score(
+        current_user.get("skills") or [],
+        current_user.get("location", ""),
+        category_counts,
+        (datetime.utcnow() - EPOCH).total_seconds(),
+        exclude=applied,
+        k=k
+    )
+    if not job_ids:
+        return []
+    
+    # Load the selected jobs, keeping the ranked order
+    jobs = {
+        str(job["_id"]): job
+        for job in jobs_collection.find({
+            "_id": {"$in": [ObjectId(job_id) for job_id in job_ids]},
+            "status": "open"
+        })
+    }
+    recommended = []
+    for position, job_id in enumerate(job_ids):
+        job = jobs.get(job_id)
+        if not job:
+            continue
+        job["score"] = round(float(scores[position]), 4)
+        job["scoreBreakdown"] = {
+            name: round(float(values[position]), 4) for name, values in components.items()
+        }
+        recommended.append(serialize_id(job))
+    return recommended
 
 @app.get("/jobs/{job_id}", response_model=JobResponse)
 async def get_job(
@@ -413,9 +1167,18 @@ async def create_application(
     created_application = applications_collection.find_one({"_id": result.inserted_id})
     return serialize_id(created_application)
 
-@app.get("/applications/job/{job_id}", response_model=List[ApplicationResponse])
+ranked_application_list_adapter = TypeAdapter(List[RankedApplicationResponse])
+
+@app.get(
+    "/applications/job/{job_id}",
+    response_model=List[ApplicationResponse],
+    # Document the optional score fields that only sort=score returns
+    responses={200: {"model": List[RankedApplicationResponse]}}
+)
 async def get_job_applications(
     job_id: str,
+    sort: Optional[str] = None,
+    k: Optional[int] = None,
     current_user: dict = Depends(get_current_user)
 ):
     # Check if job exists and user is the provider
@@ -431,10 +1194,74 @@ async def get_job_applications(
             detail="You can only view applications for your own jobs"
         )
     
+    if sort not in (None, "score"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unsupported sort mode, use 'score'"
+        )
+    if k is not None and k <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="k must be a positive integer"
+        )
+    
     # Get applications
     applications = list(applications_collection.find({"jobId": job_id}))
+    if sort == "score":
+        # Only ranked responses carry score fields; the default listing keeps its original shape
+        ranked = [serialize_id(application) for application in rank_applications(job, applications, k)]
+        return Response(
+            ranked_application_list_adapter.dump_json(ranked_application_list_adapter.validate_python(ranked)),
+            media_type="application/json"
+        )
     return [serialize_id(application) for application in applications]
 
+def rank_applications(job, applications, k=None):
+    from ranking import score_applicants, top_k
+    
+    if not applications:
+        return []
+    seeker_ids = [application["seekerId"] for application in applications]
+    
+    # Fetch current seeker ratings/locations and completion history in two batched queries
+    seekers = {
+        str(seeker["_id"]): seeker
+        for seeker in users_collection.find(
+            {"_id": {"$in": [ObjectId(seeker_id) for seeker_id in set(seeker_ids)]}},
+            {"location": 1, "rating": 1}
+        )
+    }
+    completed = {
+        entry["_id"]: entry["count"]
+        for entry in jobs_collection.aggregate([
+            {"$match": {"assignedTo": {"$in": list(set(seeker_ids))}, "status": "completed"}},
+            {"$group": {"_id": "$assignedTo", "count": {"$sum": 1}}}
+        ])
+    }
+    
+    profiles = [application.get("seekerProfile") or {} for application in applications]
+    scores, components = score_applicants(
+        job.get("requiredSkills", []),
+        job.get("location", ""),
+        [profile.get("skills") or [] for profile in profiles],
+        [
+            seekers.get(seeker_id, {}).get("rating", profile.get("rating") or 0.0)
+            for seeker_id, profile in zip(seeker_ids, profiles)
+        ],
+        [seekers.get(seeker_id, {}).get("location", "") for seeker_id in seeker_ids],
+        [completed.get(seeker_id, 0) for seeker_id in seeker_ids]
+    )
+    
+    ranked = []
+    for index in top_k(scores, k):
+        application = applications[index]
+        application["score"] = round(float(scores[index]), 4)
+        application["scoreBreakdown"] = {
+            name: round(float(values[index]), 4) for name, values in components.items()
+        }
+        ranked.append(application)
+    return ranked
+
 @app.get("/applications/seeker", response_model=List[ApplicationResponse])
 async def get_seeker_applications(
     current_user: dict = Depends(get_current_user)
@@ -508,6 +1335,8 @@ async def select_applicant(
             }
         }
     )
+    if job["status"] == "open":
+        job_closed(job)
     
     # Create notification for selected seeker
     notification = {
@@ -650,6 +1479,7 @@ async def complete_job(
                         {"_id": ObjectId(job["providerId"])},
                         {"$set": {"rating": new_rating}}
                     )
+                    update_indexed_provider_rating(job["providerId"], new_rating)
     
     # Return updated job
     updated_job = jobs_collection.find_one({"_id": ObjectId(job_id)})
@@ -663,6 +1493,142 @@ async def get_notifications(
     notifications = list(notifications_collection.find({"userId": current_user["id"]}))
     return [serialize_id(notification) for notification in notifications]
 
+@app.get("/dashboard/provider", response_model=ProviderDashboardResponse)
+async def get_provider_dashboard(
+    recent: int = DASHBOARD_RECENT_APPLICANTS,
+    current_user: dict = Depends(get_current_user)
+):
+    # Check if user is a provider
+    if current_user["userType"] != "provider":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only job providers can access this endpoint"
+        )
+    recent = max(1, min(recent, 50))
+    
+    # Join every job with its application stats in a single aggregation
+    pipeline = [
+        {"$match": {"providerId": current_user["id"]}},
+        {"$sort": {"createdAt": -1}},
+        {"$lookup": {
+            "from": applications_collection.name,
+            "let": {"jobId": {"$toString": "$_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$jobId", "$$jobId"]}}},
+                {"$sort": {"appliedAt": -1}},
+                {"$facet": {
+                    "counts": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+                    "recent": [{"$limit": recent}],
+                    "ratings": [
+                        {"$match": {"feedback.rating": {"$exists": True}}},
+                        {"$group": {
+                            "_id": None,
+                            "average": {"$avg": "$feedback.rating"},
+                            "count": {"$sum": 1}
+                        }}
+                    ]
+                }}
+            ],
+            "as": "applicationStats"
+        }},
+        {"$set": {"applicationStats": {"$first": "$applicationStats"}}}
+    ]
+    
+    jobs = []
+    jobs_by_status = {}
+    applications_by_status = {}
+    rating_sum = 0.0
+    ratings_count = 0
+    for job in jobs_collection.aggregate(pipeline):
+        job_stats = job.pop("applicationStats", None) or {}
+        counts = {entry["_id"]: entry["count"] for entry in job_stats.get("counts", [])}
+        ratings = (job_stats.get("ratings") or [{}])[0]
+        job["applicationCounts"] = counts
+        job["recentApplicants"] = [serialize_id(application) for application in job_stats.get("recent", [])]
+        job["averageRating"] = ratings.get("average")
+        job["ratingsCount"] = ratings.get("count", 0)
+        jobs.append(serialize_id(job))
+        
+        # Roll the per-job numbers up into provider totals
+        jobs_by_status[job["status"]] = jobs_by_status.get(job["status"], 0) + 1
+        for application_status, count in counts.items():
+            applications_by_status[application_status] = applications_by_status.get(application_status, 0) + count
+        if job["ratingsCount"]:
+            rating_sum += job["averageRating"] * job["ratingsCount"]
+            ratings_count += job["ratingsCount"]
+    
+    completed = jobs_by_status.get("completed", 0)
+    stats = {
+        "totalJobs": len(jobs),
+        "jobsByStatus": jobs_by_status,
+        "totalApplications": sum(applications_by_status.values()),
+        "applicationsByStatus": applications_by_status,
+        "completionRate": completed / len(jobs) if jobs else 0.0,
+        "averageRating": rating_sum / ratings_count if ratings_count else None,
+        "ratingsCount": ratings_count
+    }
+    return {"jobs": jobs, "stats": stats}
+
+@app.get("/dashboard/seeker", response_model=SeekerDashboardResponse)
+async def get_seeker_dashboard(
+    matching: int = DASHBOARD_MATCHING_JOBS,
+    current_user: dict = Depends(get_current_user)
+):
+    # Check if user is a seeker
+    if current_user["userType"] != "seeker":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only job seekers can access this endpoint"
+        )
+    matching = max(0, min(matching, 50))
+    
+    # Join applications with their job summaries in a single aggregation
+    pipeline = [
+        {"$match": {"seekerId": current_user["id"]}},
+        {"$sort": {"appliedAt": -1}},
+        {"$lookup": {
+            "from": jobs_collection.name,
+            "let": {"jobId": {"$toObjectId": "$jobId"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$jobId"]}}},
+                {"$project": JOB_SUMMARY_PROJECTION}
+            ],
+            "as": "job"
+        }},
+        {"$set": {"job": {"$first": "$job"}}}
+    ]
+    applications = []
+    applied_job_ids = []
+    for application in applications_collection.aggregate(pipeline):
+        if application.get("job"):
+            application["job"] = serialize_id(application["job"])
+        applied_job_ids.append(ObjectId(application["jobId"]))
+        applications.append(serialize_id(application))
+    
+    # Suggest the newest open jobs matching the seeker's skills that they have not applied for
+    matching_jobs = []
+    if matching and current_user.get("skills"):
+        matching_jobs = list(
+            jobs_collection.find({
+                "status": "open",
+                "requiredSkills": {"$in": current_user["skills"]},
+                "_id": {"$nin": applied_job_ids}
+            })
+            .sort("createdAt", -1)
+            .limit(matching)
+        )
+    
+    unread = notifications_collection.count_documents({
+        "userId": current_user["id"],
+        "read": False
+    })
+    
+    return {
+        "applications": applications,
+        "matchingJobs": [serialize_id(job) for job in matching_jobs],
+        "unreadNotifications": unread
+    }
+
 @app.put("/notifications/{notification_id}/read")
 async def mark_notification_read(
     notification_id: str,
@@ -701,6 +1667,67 @@ async def mark_all_notifications_read(
     
     return {"message": "All notifications marked as read"}
 
+@app.get("/admin/export/{collection}")
+async def export_collection(
+    collection: str,
+    format: str = "ndjson",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    gzip: bool = False,
+    current_user: dict = Depends(get_current_admin)
+):
+    from export import EXPORT_COLLECTIONS, stream_export
+    
+    if collection not in EXPORT_COLLECTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unknown export collection"
+        )
+    try:
+        chunks = stream_export(get_database()[collection], collection, format, since, until, status_filter, gzip)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    # Stream straight from the cursor so memory stays flat regardless of size
+    filename = f"{collection}-{datetime.utcnow():%Y%m%d%H%M%S}.{format}"
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+@app.post("/admin/jobs/expire")
+async def expire_jobs(
+    current_user: dict = Depends(get_current_admin)
+):
+    # Run a sweep now, e.g. from a cron job where no background sweeper runs
+    closed = expire_stale_jobs()
+    for job in closed:
+        job_closed(job)
+    return {"expired": len(closed)}
+
+@app.get("/metrics/coalescing")
+async def get_coalescing_metrics(
+    current_user: dict = Depends(get_current_admin)
+):
+    # Calls, database executions and share of calls served by an in-flight query, per query type
+    return single_flight.snapshot()
+
+@app.get("/metrics/pool")
+async def get_pool_metrics(
+    current_user: dict = Depends(get_current_admin)
+):
+    # Connection pool usage and checkout wait times for this worker process
+    return pool_metrics.snapshot()
+
 # Seed data if database is empty
 @app.post("/seed", status_code=status.HTTP_201_CREATED)
 async def seed_data():
@@ -708,301 +1735,25 @@ async def seed_data():
     if users_collection.count_documents({}) > 0:
         return {"message": "Database already contains data"}
     
-    # Seed users
-    users = [
-        {
-            "name": "Farmer John",
-            "email": "john@village.com",
-            "password": get_password_hash("password123"),
-            "userType": "provider",
-            "location": "North Village",
-            "phone": "123-456-7890",
-            "rating": 4.8,
-            "bio": "I own a large farm and often need help with harvesting and maintenance.",
-            "createdAt": datetime.utcnow()
-        },
-        {
-            "name": "Carpenter Mike",
-            "email": "mike@village.com",
-            "password": get_password_hash("password123"),
-            "userType": "provider",
-            "location": "East Village",
-            "phone": "123-456-7891",
-            "rating": 4.5,
-            "bio": "Master carpenter looking for assistants for various woodworking projects.",
-            "createdAt": datetime.utcnow()
-        },
-        {
-            "name": "Shopkeeper Lisa",
-            "email": "lisa@village.com",
-            "password": get_password_hash("password123"),
-            "userType": "provider",
-            "location": "Central Village",
-            "phone": "123-456-7892",
-            "rating": 4.9,
-            "bio": "I run the village general store and need help with inventory and customer service.",
-            "createdAt": datetime.utcnow()
-        },
-        {
-            "name": "Tom Smith",
-            "email": "tom@village.com",
-            "password": get_password_hash("password123"),
-            "userType": "seeker",
-            "location": "South Village",
-            "phone": "123-456-7893",
-            "rating": 4.7,
-            "bio": "Hard worker with experience in farming and construction.",
-            "skills": ["farming", "construction", "animal care"],
-            "createdAt": datetime.utcnow()
-        },
-        {
-            "name": "Sarah Johnson",
-            "email": "sarah@village.com",
-            "password": get_password_hash("password123"),
-            "userType": "seeker",
-            "location": "West Village",
-            "phone": "123-456-7894",
-            "rating": 4.6,
-            "bio": "Skilled in crafting, cooking, and childcare.",
-            "skills": ["cooking", "childcare", "crafting"],
-            "createdAt": datetime.utcnow()
-        },
-        {
-            "name": "David Lee",
-            "email": "david@village.com",
-            "password": get_password_hash("password123"),
-            "userType": "seeker",
-            "location": "North Village",
-            "phone": "123-456-7895",
-            "rating": 4.4,
-            "bio": "Strong and reliable worker, good with animals and farming.",
-            "skills": ["farming", "animal care", "heavy lifting"],
-            "createdAt": datetime.utcnow()
-        }
-    ]
-    
-    users_collection.insert_many(users)
-    
-    # Get user IDs
-    farmer_john = users_collection.find_one({"email": "john@village.com"})
-    carpenter_mike = users_collection.find_one({"email": "mike@village.com"})
-    shopkeeper_lisa = users_collection.find_one({"email": "lisa@village.com"})
-    tom_smith = users_collection.find_one({"email": "tom@village.com"})
-    sarah_johnson = users_collection.find_one({"email": "sarah@village.com"})
-    david_lee = users_collection.find_one({"email": "david@village.com"})
-    
-    # Seed jobs
-    jobs = [
-        {
-            "title": "Harvest Help Needed",
-            "description": "Looking for 2 people to help with wheat harvest. Experience preferred but not required.",
-            "location": "North Village",
-            "category": "Farming",
-            "requiredSkills": ["farming", "heavy lifting"],
-            "payment": "50 coins per day",
-            "duration": "3 days",
-            "providerId": str(farmer_john["_id"]),
-            "providerName": farmer_john["name"],
-            "status": "open",
-            "createdAt": datetime.utcnow(),
-            "applicants": 1
-        },
-        {
-            "title": "Furniture Repair Assistant",
-            "description": "Need someone to help repair village furniture. Must have basic woodworking skills.",
-            "location": "East Village",
-            "category": "Carpentry",
-            "requiredSkills": ["construction", "crafting"],
-            "payment": "70 coins per day",
-            "duration": "5 days",
-            "providerId": str(carpenter_mike["_id"]),
-            "providerName": carpenter_mike["name"],
-            "status": "open",
-            "createdAt": datetime.utcnow(),
-            "applicants": 2
-        },
-        {
-            "title": "Store Inventory Manager",
-            "description": "Help organize and manage store inventory. Must be detail-oriented and good with numbers.",
-            "location": "Central Village",
-            "category": "Retail",
-            "requiredSkills": ["organization", "mathematics"],
-            "payment": "60 coins per day",
-            "duration": "Ongoing",
-            "providerId": str(shopkeeper_lisa["_id"]),
-            "providerName": shopkeeper_lisa["name"],
-            "status": "open",
-            "createdAt": datetime.utcnow(),
-            "applicants": 0
-        },
-        {
-            "title": "Animal Caretaker",
-            "description": "Need someone to feed and care for farm animals while I am away.",
-            "location": "North Village",
-            "category": "Farming",
-            "requiredSkills": ["animal care", "farming"],
-            "payment": "55 coins per day",
-            "duration": "7 days",
-            "providerId": str(farmer_john["_id"]),
-            "providerName": farmer_john["name"],
-            "status": "assigned",
-            "assignedTo": str(david_lee["_id"]),
-            "createdAt": datetime.utcnow() - timedelta(days=7),
-            "applicants": 3
-        },
-        {
-            "title": "Festival Food Preparation",
-            "description": "Looking for someone to help prepare food for the upcoming village festival.",
-            "location": "Central Village",
-            "category": "Cooking",
-            "requiredSkills": ["cooking"],
-            "payment": "65 coins per day",
-            "duration": "2 days",
-            "providerId": str(shopkeeper_lisa["_id"]),
-            "providerName": shopkeeper_lisa["name"],
-            "status": "completed",
-            "assignedTo": str(sarah_johnson["_id"]),
-            "createdAt": datetime.utcnow() - timedelta(days=12),
-            "completedAt": datetime.utcnow() - timedelta(days=10),
-            "applicants": 2
-        }
-    ]
-    
-    jobs_collection.insert_many(jobs)
-    
-    # Get job IDs
-    harvest_job = jobs_collection.find_one({"title": "Harvest Help Needed"})
-    furniture_job = jobs_collection.find_one({"title": "Furniture Repair Assistant"})
-    inventory_job = jobs_collection.find_one({"title": "Store Inventory Manager"})
-    animal_job = jobs_collection.find_one({"title": "Animal Caretaker"})
-    festival_job = jobs_collection.find_one({"title": "Festival Food Preparation"})
-    
-    # Seed applications
-    applications = [
-        {
-            "jobId": str(harvest_job["_id"]),
-            "seekerId": str(david_lee["_id"]),
-            "seekerName": david_lee["name"],
-            "status": "pending",
-            "appliedAt": datetime.utcnow() - timedelta(hours=2),
-            "seekerProfile": {
-                "skills": david_lee["skills"],
-                "rating": david_lee["rating"],
-                "experience": david_lee["bio"]
-            }
-        },
-        {
-            "jobId": str(furniture_job["_id"]),
-            "seekerId": str(tom_smith["_id"]),
-            "seekerName": tom_smith["name"],
-            "status": "pending",
-            "appliedAt": datetime.utcnow() - timedelta(hours=1),
-            "seekerProfile": {
-                "skills": tom_smith["skills"],
-                "rating": tom_smith["rating"],
-                "experience": tom_smith["bio"]
-            }
-        },
-        {
-            "jobId": str(furniture_job["_id"]),
-            "seekerId": str(sarah_johnson["_id"]),
-            "seekerName": sarah_johnson["name"],
-            "status": "pending",
-            "appliedAt": datetime.utcnow() - timedelta(minutes=30),
-            "seekerProfile": {
-                "skills": sarah_johnson["skills"],
-                "rating": sarah_johnson["rating"],
-                "experience": sarah_johnson["bio"]
-            }
-        },
-        {
-            "jobId": str(animal_job["_id"]),
-            "seekerId": str(david_lee["_id"]),
-            "seekerName": david_lee["name"],
-            "status": "selected",
-            "appliedAt": datetime.utcnow() - timedelta(days=8),
-            "seekerProfile": {
-                "skills": david_lee["skills"],
-                "rating": david_lee["rating"],
-                "experience": david_lee["bio"]
-            }
-        },
-        {
-            "jobId": str(festival_job["_id"]),
-            "seekerId": str(sarah_johnson["_id"]),
-            "seekerName": sarah_johnson["name"],
-            "status": "completed",
-            "appliedAt": datetime.utcnow() - timedelta(days=13),
-            "seekerProfile": {
-                "skills": sarah_johnson["skills"],
-                "rating": sarah_johnson["rating"],
-                "experience": sarah_johnson["bio"]
-            },
-            "feedback": {
-                "rating": 5,
-                "comment": "Sarah did an excellent job with the festival food preparation. Everyone loved it!"
-            }
-        }
-    ]
+    from seed import seed_demo_data
     
-    applications_collection.insert_many(applications)
-    
-    # Seed notifications
-    notifications = [
-        {
-            "userId": str(farmer_john["_id"]),
-            "type": "new-application",
-            "title": "New Application",
-            "message": f"{david_lee['name']} has applied for your job: {harvest_job['title']}",
-            "read": False,
-            "timestamp": datetime.utcnow() - timedelta(hours=2)
-        },
-        {
-            "userId": str(carpenter_mike["_id"]),
-            "type": "new-application",
-            "title": "New Application",
-            "message": f"{tom_smith['name']} has applied for your job: {furniture_job['title']}",
-            "read": True,
-            "timestamp": datetime.utcnow() - timedelta(hours=1)
-        },
-        {
-            "userId": str(carpenter_mike["_id"]),
-            "type": "new-application",
-            "title": "New Application",
-            "message": f"{sarah_johnson['name']} has applied for your job: {furniture_job['title']}",
-            "read": False,
-            "timestamp": datetime.utcnow() - timedelta(minutes=30)
-        },
-        {
-            "userId": str(david_lee["_id"]),
-            "type": "job-selected",
-            "title": "Job Offer",
-            "message": f"You've been selected for the job: {animal_job['title']}",
-            "read": True,
-            "timestamp": datetime.utcnow() - timedelta(days=7)
-        },
-        {
-            "userId": str(sarah_johnson["_id"]),
-            "type": "job-feedback",
-            "title": "Job Feedback",
-            "message": f"You received a 5-star rating for the job: {festival_job['title']}. Feedback: Sarah did an excellent job with the festival food preparation. Everyone loved it!",
-            "read": False,
-            "timestamp": datetime.utcnow() - timedelta(days=10)
-        },
-        {
-            "userId": str(tom_smith["_id"]),
-            "type": "new-matching-job",
-            "title": "New Job Match",
-            "message": f"A new job matching your skills has been posted: {harvest_job['title']}",
-            "read": False,
-            "timestamp": datetime.utcnow() - timedelta(days=1)
-        }
-    ]
-    
-    notifications_collection.insert_many(notifications)
+    seed_demo_data(get_database())
     
     return {"message": "Database seeded successfully"}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True)
+    if os.getenv("APP_ENV") == "production":
+        # One worker per core; each worker sizes its Mongo pool from WEB_CONCURRENCY
+        workers = int(os.getenv("WEB_CONCURRENCY") or os.cpu_count() or 1)
+        os.environ["WEB_CONCURRENCY"] = str(workers)
+        uvicorn.run(
+            "app:app",
+            host="0.0.0.0",
+            port=int(os.getenv("PORT", "8000")),
+            workers=workers,
+            proxy_headers=True,
+            timeout_graceful_shutdown=int(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30")),
+        )
+    else:
+        uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True)
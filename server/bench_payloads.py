@@ -0,0 +1,114 @@
+"""Payload size and encode-time benchmark for list responses.
+
+Compares JSON, gzip, brotli and MessagePack encodings of JobResponse and
+NotificationResponse lists as served by ContentNegotiationMiddleware:
+
+    python bench_payloads.py --sizes 1000 10000
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from pydantic import TypeAdapter
+
+from app import JobResponse, NotificationResponse
+from negotiation import brotli, encode_body, msgpack
+
+SKILLS = ["farming", "animal care", "heavy lifting", "construction", "cooking", "childcare", "crafting"]
+LOCATIONS = ["North Village", "South Village", "East Village", "West Village", "Central Village"]
+
+
+def make_jobs(count):
+    now = datetime.utcnow()
+    return [
+        {
+            "id": str(ObjectId()),
+            "title": f"Harvest help needed #{index}",
+            "description": "Looking for people to help with the wheat harvest. Experience preferred but not required.",
+            "location": LOCATIONS[index % len(LOCATIONS)],
+            "category": "Farming",
+            "requiredSkills": [SKILLS[index % len(SKILLS)], SKILLS[(index + 3) % len(SKILLS)]],
+            "payment": f"{50 + index % 40} coins per day",
+            "duration": f"{1 + index % 10} days",
+            "providerId": str(ObjectId()),
+            "providerName": "Farmer John",
+            "status": "open",
+            "createdAt": now - timedelta(minutes=index),
+            "expiresAt": now + timedelta(days=30),
+            "applicants": index % 7,
+        }
+        for index in range(count)
+    ]
+
+
+def make_notifications(count):
+    now = datetime.utcnow()
+    return [
+        {
+            "id": str(ObjectId()),
+            "userId": str(ObjectId()),
+            "type": "new-matching-job",
+            "title": "New Job Match",
+            "message": f"A new job matching your skills has been posted: Harvest help needed #{index}",
+            "read": index % 2 == 0,
+            "timestamp": now - timedelta(minutes=index),
+        }
+        for index in range(count)
+    ]
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best * 1000
+
+
+def bench(name, adapter, items, repeat):
+    json_body, json_ms = timed(lambda: adapter.dump_json(adapter.validate_python(items)), repeat)
+    rows = [("json", len(json_body), json_ms)]
+
+    body, ms = timed(lambda: encode_body(json_body, "gzip"), repeat)
+    rows.append(("json+gzip", len(body), json_ms + ms))
+    if brotli is not None:
+        body, ms = timed(lambda: encode_body(json_body, "br"), repeat)
+        rows.append(("json+br", len(body), json_ms + ms))
+    if msgpack is not None:
+        # Same path as the middleware: the JSON body is re-encoded as MessagePack
+        packed, ms = timed(lambda: msgpack.packb(json.loads(json_body)), repeat)
+        rows.append(("msgpack", len(packed), json_ms + ms))
+        body, ms_gzip = timed(lambda: encode_body(packed, "gzip"), repeat)
+        rows.append(("msgpack+gzip", len(body), json_ms + ms + ms_gzip))
+        if brotli is not None:
+            body, ms_br = timed(lambda: encode_body(packed, "br"), repeat)
+            rows.append(("msgpack+br", len(body), json_ms + ms + ms_br))
+
+    print(f"{name} x {len(items)}")
+    print(f"  {'encoding':<14}{'bytes':>12}{'ratio':>8}{'encode ms':>12}")
+    for encoding, size, ms in rows:
+        print(f"  {encoding:<14}{size:>12}{size / len(json_body):>8.2f}{ms:>12.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark list payload encodings")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5, help="Best of this many runs per encoding")
+    args = parser.parse_args(argv)
+
+    job_adapter = TypeAdapter(List[JobResponse])
+    notification_adapter = TypeAdapter(List[NotificationResponse])
+    for size in args.sizes:
+        bench("JobResponse", job_adapter, make_jobs(size), args.repeat)
+        bench("NotificationResponse", notification_adapter, make_notifications(size), args.repeat)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
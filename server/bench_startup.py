@@ -0,0 +1,92 @@
+"""Cold-start benchmark for the API module.
+
+Imports app.py in fresh interpreters, reports the median wall time and the
+slowest imported modules, and exits non-zero when the median exceeds the
+import-time budget:
+
+    python bench_startup.py --runs 10 --budget-ms 500 [--ping]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Default budget for importing app.py in a fresh interpreter
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "500"))
+
+IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+print("import_ms", (imported - started) * 1000)
+if {ping}:
+    app.get_client().admin.command("ping")
+    print("ping_ms", (time.perf_counter() - imported) * 1000)
+"""
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def run_import(ping=False):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET.format(ping=ping)],
+        cwd=HERE, capture_output=True, text=True, check=True
+    )
+    timings = {}
+    for line in result.stdout.splitlines():
+        name, value = line.split()
+        timings[name] = float(value)
+    return timings
+
+
+def slowest_imports(limit):
+    # Packages imported directly by app.py, by cumulative import time from -X importtime
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=HERE, capture_output=True, text=True, check=True
+    )
+    packages = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        # One space of indent is "app" itself, three spaces are its direct imports
+        if match and len(match.group(3)) == 3:
+            cumulative = int(match.group(2))
+            package = match.group(4).split(".")[0]
+            packages[package] = packages.get(package, 0) + cumulative
+    return sorted(packages.items(), key=lambda item: item[1], reverse=True)[:limit]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure cold-start import time of app.py")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports to list")
+    parser.add_argument("--ping", action="store_true", help="Also time the first MongoDB round trip")
+    args = parser.parse_args(argv)
+
+    runs = [run_import(args.ping) for _ in range(args.runs)]
+    import_ms = statistics.median(run["import_ms"] for run in runs)
+    print(f"import app: median {import_ms:.1f} ms over {args.runs} runs "
+          f"(min {min(run['import_ms'] for run in runs):.1f}, max {max(run['import_ms'] for run in runs):.1f})")
+    if args.ping:
+        ping_ms = statistics.median(run["ping_ms"] for run in runs)
+        print(f"first MongoDB round trip: median {ping_ms:.1f} ms")
+
+    print("slowest imports of app.py (cumulative):")
+    for package, microseconds in slowest_imports(args.top):
+        print(f"  {package:<24} {microseconds / 1000:8.1f} ms")
+
+    if import_ms > args.budget_ms:
+        print(f"FAIL: import time {import_ms:.1f} ms exceeds budget of {args.budget_ms:.0f} ms")
+        return 1
+    print(f"OK: within budget of {args.budget_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Single-flight coalescing of identical concurrent reads.
+
+Concurrent callers that ask for the same key while a call is in flight await
+that call's result instead of issuing their own query. The blocking call runs
+in the threadpool so the event loop keeps accepting the requests that join it.
+"""
+import asyncio
+import threading
+
+from starlette.concurrency import run_in_threadpool
+
+
+class SingleFlight:
+    def __init__(self):
+        self.inflight = {}
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def _count(self, name, field):
+        with self.lock:
+            stats = self.stats.setdefault(name, {"calls": 0, "executions": 0, "coalesced": 0, "errors": 0})
+            stats[field] += 1
+
+    async def do(self, name, key, fn, *args):
+        # name groups metrics per query type; key identifies the normalized query shape and parameters
+        flight_key = (name, key)
+        self._count(name, "calls")
+        task = self.inflight.get(flight_key)
+        if task is not None:
+            self._count(name, "coalesced")
+        else:
+            self._count(name, "executions")
+            # The shared call is its own task so it finishes even if the caller that started it is cancelled
+            task = asyncio.get_running_loop().create_task(self._run(name, flight_key, fn, args))
+            task.add_done_callback(self._retrieve)
+            self.inflight[flight_key] = task
+        # shield so one cancelled caller does not cancel the shared call for the others
+        return await asyncio.shield(task)
+
+    async def _run(self, name, flight_key, fn, args):
+        try:
+            return await run_in_threadpool(fn, *args)
+        except Exception:
+            self._count(name, "errors")
+            raise
+        finally:
+            del self.inflight[flight_key]
+
+    def _retrieve(self, task):
+        # Mark a failure retrieved so it is not reported as never retrieved when every caller left
+        if not task.cancelled():
+            task.exception()
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                name: {
+                    **stats,
+                    "coalescingRatio": stats["coalesced"] / stats["calls"] if stats["calls"] else 0.0,
+                }
+                for name, stats in self.stats.items()
+            }
@@ -0,0 +1,185 @@
+"""Streaming NDJSON/CSV export of jobs, applications and notifications.
+
+Used by the /admin/export endpoints and runnable as a CLI:
+
+    python export.py jobs --format csv --since 2024-01-01 --status completed --gzip -o jobs.csv.gz
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import zlib
+from datetime import datetime
+
+from bson import ObjectId
+
+# Date field and CSV columns of each exportable collection
+EXPORT_COLLECTIONS = {
+    "jobs": {
+        "date_field": "createdAt",
+        "columns": [
+            "id", "title", "description", "location", "category", "requiredSkills", "payment",
+            "duration", "providerId", "providerName", "status", "createdAt", "applicants",
+            "assignedTo", "completedAt", "expiresAt", "expiredAt"
+        ],
+    },
+    "applications": {
+        "date_field": "appliedAt",
+        "columns": [
+            "id", "jobId", "seekerId", "seekerName", "status", "appliedAt", "seekerProfile", "feedback"
+        ],
+    },
+    "notifications": {
+        "date_field": "timestamp",
+        "columns": ["id", "userId", "type", "title", "message", "read", "timestamp"],
+    },
+}
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# Documents fetched from Mongo per cursor batch
+EXPORT_BATCH_SIZE = 1000
+
+
+def parse_date(value):
+    if value is None or isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def build_export_query(collection_name, since=None, until=None, status=None):
+    date_field = EXPORT_COLLECTIONS[collection_name]["date_field"]
+    query = {}
+    date_range = {}
+    if since:
+        date_range["$gte"] = parse_date(since)
+    if until:
+        date_range["$lt"] = parse_date(until)
+    if date_range:
+        query[date_field] = date_range
+    if status:
+        if collection_name == "notifications":
+            # Notifications only have a read flag
+            if status not in ("read", "unread"):
+                raise ValueError("Notification status must be 'read' or 'unread'")
+            query["read"] = status == "read"
+        else:
+            query["status"] = status
+    return query
+
+
+def iter_documents(collection, query, batch_size=EXPORT_BATCH_SIZE):
+    # Only one cursor batch is held in memory at a time
+    cursor = collection.find(query).batch_size(batch_size)
+    try:
+        for document in cursor:
+            if "_id" in document:
+                document["id"] = str(document.pop("_id"))
+            yield document
+    finally:
+        cursor.close()
+
+
+def _json_default(value):
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def iter_ndjson(documents):
+    for document in documents:
+        yield (json.dumps(document, default=_json_default) + "\n").encode("utf-8")
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return ";".join(str(item) for item in value)
+    if isinstance(value, dict):
+        return json.dumps(value, default=_json_default)
+    return value
+
+
+def iter_csv(documents, columns, rows_per_chunk=500):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    rows = 0
+    for document in documents:
+        writer.writerow([_csv_value(document.get(column)) for column in columns])
+        rows += 1
+        if rows % rows_per_chunk == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode("utf-8")
+
+
+def iter_gzip(chunks, level=6):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_export(collection, collection_name, format="ndjson", since=None, until=None, status=None,
+                  gzip=False, batch_size=EXPORT_BATCH_SIZE):
+    if collection_name not in EXPORT_COLLECTIONS:
+        raise ValueError(f"Unknown collection '{collection_name}'")
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format '{format}', use 'ndjson' or 'csv'")
+    query = build_export_query(collection_name, since, until, status)
+    documents = iter_documents(collection, query, batch_size)
+    if format == "csv":
+        chunks = iter_csv(documents, EXPORT_COLLECTIONS[collection_name]["columns"])
+    else:
+        chunks = iter_ndjson(documents)
+    return iter_gzip(chunks) if gzip else chunks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export Village Jobs data as NDJSON or CSV")
+    parser.add_argument("collection", choices=sorted(EXPORT_COLLECTIONS))
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+    parser.add_argument("--since", help="Only documents dated on or after this ISO date")
+    parser.add_argument("--until", help="Only documents dated before this ISO date")
+    parser.add_argument("--status", help="Job/application status, or read/unread for notifications")
+    parser.add_argument("--gzip", action="store_true", help="Gzip the output")
+    parser.add_argument("--batch-size", type=int, default=EXPORT_BATCH_SIZE)
+    parser.add_argument("-o", "--output", help="Output file (defaults to stdout)")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+
+    load_dotenv()
+    client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    try:
+        chunks = stream_export(
+            client["village_jobs"][args.collection], args.collection, args.format,
+            args.since, args.until, args.status, args.gzip, args.batch_size
+        )
+        output = open(args.output, "wb") if args.output else sys.stdout.buffer
+        try:
+            for chunk in chunks:
+                output.write(chunk)
+        finally:
+            if args.output:
+                output.close()
+    except ValueError as e:
+        parser.error(str(e))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Open-job facet counts and prefix autocomplete for the job filter UIs."""
+from collections import Counter
+
+FACET_FIELDS = ("location", "category", "requiredSkills")
+
+# Autocomplete suggestion kind for each facet field
+FIELD_KINDS = {
+    "location": "location",
+    "category": "category",
+    "requiredSkills": "skill",
+}
+
+
+class FacetCounts:
+    """Counts of open jobs per location, category and required skill."""
+
+    def __init__(self):
+        self.counts = {field: Counter() for field in FACET_FIELDS}
+        self.total = 0
+
+    def values(self, job, field):
+        value = job.get(field)
+        if field == "requiredSkills":
+            # A skill listed twice on one job still counts the job once
+            return set(value or ())
+        return (value,) if value else ()
+
+    def add(self, job, delta=1):
+        self.total += delta
+        for field in FACET_FIELDS:
+            counts = self.counts[field]
+            for value in self.values(job, field):
+                counts[value] += delta
+                if counts[value] <= 0:
+                    del counts[value]
+
+    def remove(self, job):
+        self.add(job, -1)
+
+    def load(self, field, value_counts):
+        self.counts[field] = Counter({value: count for value, count in value_counts if value})
+
+    def snapshot(self, limit=None):
+        return {
+            field: [{"value": value, "count": count} for value, count in self.counts[field].most_common(limit)]
+            for field in FACET_FIELDS
+        }
+
+
+class PrefixTrie:
+    """Case-insensitive prefix trie of terms, each tagged with a kind and a weight."""
+
+    def __init__(self):
+        self.root = {}
+        self.size = 0
+
+    def insert(self, term, kind, weight=0):
+        key = (term or "").strip().lower()
+        if not key:
+            return
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        entries = node.setdefault(None, {})
+        if kind not in entries:
+            self.size += 1
+        entries[kind] = (term.strip(), weight)
+
+    def add(self, term, kind, delta=1):
+        # Adjust the weight of a term, inserting it first if it is new
+        node = self._find((term or "").strip().lower())
+        if node is None or kind not in node.get(None, {}):
+            self.insert(term, kind, max(0, delta))
+            return
+        display, weight = node[None][kind]
+        node[None][kind] = (display, max(0, weight + delta))
+
+    def _find(self, key):
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def complete(self, prefix, limit=10, kinds=None):
+        node = self._find((prefix or "").strip().lower())
+        if node is None:
+            return []
+        matches = []
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for char, child in current.items():
+                if char is None:
+                    for kind, (term, weight) in child.items():
+                        if kinds is None or kind in kinds:
+                            matches.append({"value": term, "kind": kind, "count": weight})
+                else:
+                    stack.append(child)
+        # Most open jobs first, then shortest and alphabetical
+        matches.sort(key=lambda match: (-match["count"], len(match["value"]), match["value"].lower()))
+        return matches[:limit]
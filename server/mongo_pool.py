@@ -0,0 +1,125 @@
+"""MongoDB connection pool sizing and pool wait-time metrics.
+
+Pool limits are per process. With several API workers the total number of
+connections is roughly workers x maxPoolSize, so when MONGO_MAX_CONNECTIONS
+is set it is divided evenly between the WEB_CONCURRENCY workers.
+"""
+import os
+import threading
+
+from pymongo import monitoring
+
+# Upper bounds (in milliseconds) of the checkout wait-time histogram buckets
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+def worker_count():
+    return max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+
+def pool_options():
+    # MongoClient keyword arguments for this worker's connection pool
+    total = os.getenv("MONGO_MAX_CONNECTIONS")
+    if total:
+        max_pool_size = max(1, int(total) // worker_count())
+    else:
+        max_pool_size = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+    min_pool_size = min(int(os.getenv("MONGO_MIN_POOL_SIZE", "0")), max_pool_size)
+    return {
+        "maxPoolSize": max_pool_size,
+        "minPoolSize": min_pool_size,
+        "waitQueueTimeoutMS": int(os.getenv("MONGO_WAIT_QUEUE_TIMEOUT_MS", "2000")),
+        "maxIdleTimeMS": int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "300000")),
+    }
+
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    """Counts pool checkouts and how long requests wait for a connection."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.checkouts = 0
+            self.failures = {}
+            self.wait_total_ms = 0.0
+            self.wait_max_ms = 0.0
+            self.wait_buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+            self.in_use = 0
+            self.open = 0
+            self.cleared = 0
+
+    def _record_wait(self, duration):
+        if duration is None:
+            return
+        wait_ms = duration * 1000
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+        for index, bound in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= bound:
+                self.wait_buckets[index] += 1
+                break
+        else:
+            self.wait_buckets[-1] += 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_checked_out(self, event):
+        with self.lock:
+            self.checkouts += 1
+            self.in_use += 1
+            self._record_wait(getattr(event, "duration", None))
+
+    def connection_check_out_failed(self, event):
+        with self.lock:
+            self.failures[event.reason] = self.failures.get(event.reason, 0) + 1
+            self._record_wait(getattr(event, "duration", None))
+
+    def connection_checked_in(self, event):
+        with self.lock:
+            self.in_use = max(0, self.in_use - 1)
+
+    def connection_created(self, event):
+        with self.lock:
+            self.open += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self.lock:
+            self.open = max(0, self.open - 1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self.lock:
+            self.cleared += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def snapshot(self):
+        with self.lock:
+            waits = self.checkouts + sum(self.failures.values())
+            buckets = {f"le_{bound}ms": count for bound, count in zip(WAIT_BUCKETS_MS, self.wait_buckets)}
+            buckets["gt_{}ms".format(WAIT_BUCKETS_MS[-1])] = self.wait_buckets[-1]
+            return {
+                "pid": os.getpid(),
+                "options": pool_options(),
+                "checkouts": self.checkouts,
+                "checkoutFailures": dict(self.failures),
+                "inUse": self.in_use,
+                "open": self.open,
+                "poolCleared": self.cleared,
+                "waitAvgMs": self.wait_total_ms / waits if waits else 0.0,
+                "waitMaxMs": self.wait_max_ms,
+                "waitHistogram": buckets,
+            }
@@ -0,0 +1,134 @@
+"""Response compression and MessagePack negotiation for JSON responses.
+
+JSON responses are re-encoded as MessagePack when the client sends
+"Accept: application/msgpack", and compressed with brotli or gzip (following
+Accept-Encoding) once they reach the minimum size. brotli and msgpack are
+optional; without them the middleware only offers gzip and JSON. Every JSON
+response carries "Vary: Accept, Accept-Encoding" so caches keep the variants
+apart, and large bodies are encoded in a worker thread off the event loop.
+"""
+import gzip
+import json
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+
+from tracing import tracer
+
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def accepted_encodings(header):
+    # Encodings from Accept-Encoding, leaving out any marked q=0
+    encodings = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if params.replace(" ", "").lower() in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name:
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+def choose_encoding(header):
+    encodings = accepted_encodings(header)
+    if brotli is not None and "br" in encodings:
+        return "br"
+    if "gzip" in encodings or "*" in encodings:
+        return "gzip"
+    return None
+
+
+def wants_msgpack(header):
+    return msgpack is not None and any(media_type in header.lower() for media_type in MSGPACK_MEDIA_TYPES)
+
+
+def encode_body(body, encoding, gzip_level=5, brotli_quality=4):
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level)
+
+
+class ContentNegotiationMiddleware:
+    def __init__(self, app, minimum_size=1024, gzip_level=5, brotli_quality=4, offload_size=256 * 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        # Bodies at least this large are encoded in a worker thread
+        self.offload_size = offload_size
+
+    def encode(self, body, to_msgpack, encoding):
+        # Returns the new body and whether it was compressed
+        if to_msgpack and body:
+            with tracer.span("serialize.msgpack", bytes=len(body)):
+                body = msgpack.packb(json.loads(body))
+        if encoding is not None and len(body) >= self.minimum_size:
+            with tracer.span(f"compress.{encoding}", bytes=len(body)):
+                return encode_body(body, encoding, self.gzip_level, self.brotli_quality), True
+        return body, False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        to_msgpack = wants_msgpack(request_headers.get("accept", ""))
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""))
+        negotiate = to_msgpack or encoding is not None
+
+        start = None
+        chunks = []
+        passthrough = False
+
+        async def negotiated_send(message):
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=list(message["headers"]))
+                # Streams (exports) and already-encoded bodies are left untouched
+                if not headers.get("content-type", "").startswith("application/json") or "content-encoding" in headers:
+                    passthrough = True
+                    await send(message)
+                    return
+                # Any JSON response could have been negotiated, so caches must key on both headers
+                headers.add_vary_header("Accept-Encoding")
+                headers.add_vary_header("Accept")
+                if not negotiate:
+                    passthrough = True
+                    await send({**message, "headers": headers.raw})
+                else:
+                    start = {**message, "headers": headers.raw}
+                return
+            if passthrough or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            packed = to_msgpack and bool(body)
+            if len(body) >= self.offload_size:
+                body, compressed = await anyio.to_thread.run_sync(self.encode, body, to_msgpack, encoding)
+            else:
+                body, compressed = self.encode(body, to_msgpack, encoding)
+            headers = MutableHeaders(raw=list(start["headers"]))
+            if packed:
+                headers["content-type"] = "application/msgpack"
+            if compressed:
+                headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(body))
+            await send({**start, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, negotiated_send)
@@ -0,0 +1,254 @@
+"""Vectorized scoring helpers used to rank applicants and jobs."""
+from itertools import chain
+
+import numpy as np
+
+# Approximate grid positions of the village areas, used for proximity scoring
+LOCATION_COORDINATES = {
+    "central village": (0.0, 0.0),
+    "north village": (0.0, 1.0),
+    "south village": (0.0, -1.0),
+    "east village": (1.0, 0.0),
+    "west village": (-1.0, 0.0),
+}
+
+# Relative weight of each signal in the applicant score
+APPLICANT_WEIGHTS = {
+    "skills": 0.45,
+    "rating": 0.25,
+    "proximity": 0.15,
+    "history": 0.15,
+}
+
+# Completed jobs needed for the history signal to reach 0.5
+HISTORY_HALF_SATURATION = 3.0
+
+MAX_RATING = 5.0
+
+
+def normalize_term(value):
+    return (value or "").strip().lower()
+
+
+def build_vocabulary(terms):
+    vocabulary = {}
+    for term in terms:
+        term = normalize_term(term)
+        if term and term not in vocabulary:
+            vocabulary[term] = len(vocabulary)
+    return vocabulary
+
+
+def encode_terms(term_lists, vocabulary):
+    # One row per entity, one column per vocabulary term; unknown terms are dropped
+    matrix = np.zeros((len(term_lists), max(len(vocabulary), 1)), dtype=np.float32)
+    flat = list(chain.from_iterable(term_lists))
+    if not flat:
+        return matrix
+    # Normalize each distinct term once instead of once per occurrence
+    columns = {term: vocabulary.get(normalize_term(term), -1) for term in set(flat)}
+    cols = np.fromiter(map(columns.__getitem__, flat), dtype=np.intp, count=len(flat))
+    lengths = np.fromiter(map(len, term_lists), dtype=np.intp, count=len(term_lists))
+    rows = np.repeat(np.arange(len(term_lists)), lengths)
+    known = cols >= 0
+    matrix[rows[known], cols[known]] = 1.0
+    return matrix
+
+
+def location_proximity(locations, target):
+    # 1.0 for the same area, decaying with grid distance; unknown areas only match exactly
+    # Code each distinct area once; the per-applicant lookup stays in C via map
+    codes = {location: code for code, location in enumerate(set(locations))}
+    inverse = np.fromiter(map(codes.__getitem__, locations), dtype=np.intp, count=len(locations))
+    target_key = normalize_term(target)
+    target_xy = LOCATION_COORDINATES.get(target_key)
+    proximity = np.zeros(len(codes), dtype=np.float32)
+    for location, code in codes.items():
+        key = normalize_term(location)
+        xy = LOCATION_COORDINATES.get(key)
+        if key == target_key:
+            proximity[code] = 1.0
+        elif xy is not None and target_xy is not None:
+            proximity[code] = 1.0 / (1.0 + np.hypot(xy[0] - target_xy[0], xy[1] - target_xy[1]))
+    return proximity[inverse]
+
+
+def score_applicants(required_skills, job_location, skill_lists, ratings, locations, completed_counts):
+    vocabulary = build_vocabulary(required_skills)
+    skill_matrix = encode_terms(skill_lists, vocabulary)
+    required = max(len(vocabulary), 1)
+    completed = np.asarray(completed_counts, dtype=np.float32)
+
+    components = {
+        "skills": skill_matrix.sum(axis=1) / required,
+        "rating": np.clip(np.asarray(ratings, dtype=np.float32) / MAX_RATING, 0.0, 1.0),
+        "proximity": location_proximity(locations, job_location),
+        "history": completed / (completed + HISTORY_HALF_SATURATION),
+    }
+
+    scores = np.zeros(len(skill_lists), dtype=np.float32)
+    for name, weight in APPLICANT_WEIGHTS.items():
+        scores += weight * components[name]
+    return scores, components
+
+
+def top_k(scores, k):
+    # Indices of the k best scores, best first
+    n = len(scores)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+# Relative weight of each signal in the job recommendation score
+RECOMMENDATION_WEIGHTS = {
+    "skills": 0.4,
+    "recency": 0.2,
+    "rating": 0.15,
+    "proximity": 0.15,
+    "category": 0.1,
+}
+
+# Age in days at which the recency signal decays to 1/e
+RECENCY_DECAY_DAYS = 7.0
+
+
+class JobFeatureIndex:
+    """Compact per-job feature arrays for open jobs, updated in place as jobs change."""
+
+    def __init__(self, capacity=256, skill_capacity=32):
+        self.slots = {}
+        self.job_ids = []
+        self.free_slots = []
+        self.vocabulary = {}
+        self.locations = {}
+        self.categories = {}
+        self.providers = {}
+        self.active = np.zeros(0, dtype=bool)
+        self.skills = np.zeros((0, 0), dtype=np.float32)
+        self.created = np.zeros(0, dtype=np.float64)
+        self.rating = np.zeros(0, dtype=np.float32)
+        self.location_codes = np.zeros(0, dtype=np.intp)
+        self.category_codes = np.zeros(0, dtype=np.intp)
+        self.provider_codes = np.zeros(0, dtype=np.intp)
+        self.provider_ratings = np.zeros(0, dtype=np.float32)
+        self._grow(capacity, skill_capacity)
+
+    def __len__(self):
+        return len(self.slots)
+
+    def _grow(self, rows, cols):
+        old_rows, old_cols = self.skills.shape
+        skills = np.zeros((rows, cols), dtype=np.float32)
+        skills[:old_rows, :old_cols] = self.skills
+        self.skills = skills
+        if rows > old_rows:
+            extra = rows - old_rows
+            self.active = np.concatenate([self.active, np.zeros(extra, dtype=bool)])
+            self.created = np.concatenate([self.created, np.zeros(extra, dtype=np.float64)])
+            self.location_codes = np.concatenate([self.location_codes, np.zeros(extra, dtype=np.intp)])
+            self.category_codes = np.concatenate([self.category_codes, np.zeros(extra, dtype=np.intp)])
+            self.provider_codes = np.concatenate([self.provider_codes, np.zeros(extra, dtype=np.intp)])
+
+    def _code(self, codes, value):
+        return codes.setdefault(value, len(codes))
+
+    def _provider_code(self, provider_id, rating):
+        code = self._code(self.providers, provider_id)
+        if code >= len(self.provider_ratings):
+            self.provider_ratings = np.concatenate([
+                self.provider_ratings,
+                np.zeros(max(code + 1, 2 * len(self.provider_ratings)) - len(self.provider_ratings), dtype=np.float32)
+            ])
+        self.provider_ratings[code] = rating or 0.0
+        return code
+
+    def upsert(self, job_id, required_skills, created_at, location, category, provider_id, provider_rating):
+        slot = self.slots.get(job_id)
+        if slot is None:
+            if self.free_slots:
+                slot = self.free_slots.pop()
+                self.job_ids[slot] = job_id
+            else:
+                slot = len(self.job_ids)
+                self.job_ids.append(job_id)
+                if slot >= len(self.active):
+                    self._grow(max(2 * len(self.active), 16), self.skills.shape[1])
+            self.slots[job_id] = slot
+
+        columns = [self._code(self.vocabulary, normalize_term(skill)) for skill in required_skills or ()]
+        if columns and max(columns) >= self.skills.shape[1]:
+            self._grow(self.skills.shape[0], max(2 * self.skills.shape[1], max(columns) + 1))
+        self.skills[slot] = 0.0
+        self.skills[slot, columns] = 1.0
+        self.created[slot] = created_at
+        self.location_codes[slot] = self._code(self.locations, normalize_term(location))
+        self.category_codes[slot] = self._code(self.categories, normalize_term(category))
+        self.provider_codes[slot] = self._provider_code(provider_id, provider_rating)
+        self.active[slot] = True
+
+    def remove(self, job_id):
+        slot = self.slots.pop(job_id, None)
+        if slot is None:
+            return
+        self.active[slot] = False
+        self.job_ids[slot] = None
+        self.free_slots.append(slot)
+
+    def set_provider_rating(self, provider_id, rating):
+        code = self.providers.get(provider_id)
+        if code is not None:
+            self.provider_ratings[code] = rating or 0.0
+
+    def score(self, skills, location, category_counts, now, exclude=(), k=None):
+        candidates = self.active.copy()
+        for job_id in exclude:
+            slot = self.slots.get(job_id)
+            if slot is not None:
+                candidates[slot] = False
+        rows = np.flatnonzero(candidates)
+        if not len(rows):
+            return [], np.zeros(0, dtype=np.float32), {}
+        skill_matrix = self.skills[rows]
+
+        # Rare skills count for more: inverse document frequency over the open jobs
+        document_frequency = skill_matrix.sum(axis=0)
+        weights = np.log1p(len(rows) / (1.0 + document_frequency)).astype(np.float32)
+        seeker_columns = [
+            self.vocabulary[term] for term in {normalize_term(skill) for skill in skills or ()}
+            if term in self.vocabulary
+        ]
+        required_weight = skill_matrix @ weights
+        covered_weight = skill_matrix[:, seeker_columns] @ weights[seeker_columns]
+        skill_score = np.divide(
+            covered_weight, required_weight,
+            out=np.zeros(len(rows), dtype=np.float32), where=required_weight > 0
+        )
+
+        location_names = list(self.locations)
+        proximity_by_code = location_proximity(location_names, location) if location_names else np.zeros(0)
+        category_affinity = np.zeros(len(self.categories), dtype=np.float32)
+        total = sum(category_counts.values())
+        for category, count in category_counts.items():
+            code = self.categories.get(normalize_term(category))
+            if code is not None and total:
+                category_affinity[code] = count / total
+
+        age_days = np.maximum(now - self.created[rows], 0.0) / 86400.0
+        components = {
+            "skills": skill_score,
+            "recency": np.exp(-age_days / RECENCY_DECAY_DAYS).astype(np.float32),
+            "rating": np.clip(self.provider_ratings[self.provider_codes[rows]] / MAX_RATING, 0.0, 1.0),
+            "proximity": proximity_by_code[self.location_codes[rows]].astype(np.float32),
+            "category": category_affinity[self.category_codes[rows]],
+        }
+        scores = np.zeros(len(rows), dtype=np.float32)
+        for name, weight in RECOMMENDATION_WEIGHTS.items():
+            scores += weight * components[name]
+
+        order = top_k(scores, k)
+        job_ids = [self.job_ids[rows[index]] for index in order]
+        return job_ids, scores[order], {name: values[order] for name, values in components.items()}
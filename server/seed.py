@@ -0,0 +1,629 @@
+"""Demo and synthetic data seeding for the Village Jobs database.
+
+The fixed demo dataset backs POST /seed. Synthetic data for load testing is
+generated from the command line:
+
+    python seed.py --users 100000 --jobs 50000 --applications 500000 --notifications 1000000
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import bcrypt
+import numpy as np
+from bson import ObjectId
+
+DEFAULT_PASSWORD = "password123"
+
+SKILLS = [
+    "farming", "animal care", "heavy lifting", "construction", "cooking", "cleaning",
+    "childcare", "crafting", "carpentry", "driving", "organization", "mathematics",
+    "sewing", "painting", "plumbing", "gardening", "fishing", "elder care",
+    "teaching", "masonry",
+]
+
+LOCATIONS = ["North Village", "South Village", "East Village", "West Village", "Central Village"]
+
+# Job category per skill, used to keep generated categories consistent with skills
+SKILL_CATEGORIES = {
+    "farming": "Farming", "animal care": "Farming", "heavy lifting": "Farming",
+    "gardening": "Farming", "fishing": "Farming", "construction": "Construction",
+    "masonry": "Construction", "plumbing": "Construction", "painting": "Construction",
+    "carpentry": "Carpentry", "crafting": "Carpentry", "sewing": "Crafts",
+    "cooking": "Cooking", "cleaning": "Household", "childcare": "Household",
+    "elder care": "Household", "driving": "Transport", "organization": "Retail",
+    "mathematics": "Retail", "teaching": "Education",
+}
+
+FIRST_NAMES = ["Asha", "Ravi", "Meena", "Tom", "Sarah", "David", "Lisa", "Mike", "John", "Priya", "Arjun", "Nina"]
+LAST_NAMES = ["Smith", "Kumar", "Johnson", "Lee", "Patel", "Singh", "Brown", "Das", "Garcia", "Khan"]
+
+NOTIFICATION_TYPES = ["new-application", "job-selected", "job-feedback", "new-matching-job"]
+
+# Matches the API's default JOB_DEFAULT_TTL_DAYS
+JOB_TTL_DAYS = 30
+
+
+def get_password_hash(password):
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
+
+
+def seed_demo_data(db):
+    now = datetime.utcnow()
+    password = get_password_hash(DEFAULT_PASSWORD)
+    
+    # Seed users
+    users = [
+        {
+            "name": "Farmer John",
+            "email": "john@village.com",
+            "password": password,
+            "userType": "provider",
+            "location": "North Village",
+            "phone": "123-456-7890",
+            "rating": 4.8,
+            "bio": "I own a large farm and often need help with harvesting and maintenance.",
+            "createdAt": now
+        },
+        {
+            "name": "Carpenter Mike",
+            "email": "mike@village.com",
+            "password": password,
+            "userType": "provider",
+            "location": "East Village",
+            "phone": "123-456-7891",
+            "rating": 4.5,
+            "bio": "Master carpenter looking for assistants for various woodworking projects.",
+            "createdAt": now
+        },
+        {
+            "name": "Shopkeeper Lisa",
+            "email": "lisa@village.com",
+            "password": password,
+            "userType": "provider",
+            "location": "Central Village",
+            "phone": "123-456-7892",
+            "rating": 4.9,
+            "bio": "I run the village general store and need help with inventory and customer service.",
+            "createdAt": now
+        },
+        {
+            "name": "Tom Smith",
+            "email": "tom@village.com",
+            "password": password,
+            "userType": "seeker",
+            "location": "South Village",
+            "phone": "123-456-7893",
+            "rating": 4.7,
+            "bio": "Hard worker with experience in farming and construction.",
+            "skills": ["farming", "construction", "animal care"],
+            "createdAt": now
+        },
+        {
+            "name": "Sarah Johnson",
+            "email": "sarah@village.com",
+            "password": password,
+            "userType": "seeker",
+            "location": "West Village",
+            "phone": "123-456-7894",
+            "rating": 4.6,
+            "bio": "Skilled in crafting, cooking, and childcare.",
+            "skills": ["cooking", "childcare", "crafting"],
+            "createdAt": now
+        },
+        {
+            "name": "David Lee",
+            "email": "david@village.com",
+            "password": password,
+            "userType": "seeker",
+            "location": "North Village",
+            "phone": "123-456-7895",
+            "rating": 4.4,
+            "bio": "Strong and reliable worker, good with animals and farming.",
+            "skills": ["farming", "animal care", "heavy lifting"],
+            "createdAt": now
+        }
+    ]
+    
+    db["users"].insert_many(users)
+    
+    # insert_many assigns the _id of each document client-side, so no re-query is needed
+    farmer_john, carpenter_mike, shopkeeper_lisa, tom_smith, sarah_johnson, david_lee = users
+    
+    
+    # Seed jobs
+    jobs = [
+        {
+            "title": "Harvest Help Needed",
+            "description": "Looking for 2 people to help with wheat harvest. Experience preferred but not required.",
+            "location": "North Village",
+            "category": "Farming",
+            "requiredSkills": ["farming", "heavy lifting"],
+            "payment": "50 coins per day",
+            "duration": "3 days",
+            "providerId": str(farmer_john["_id"]),
+            "providerName": farmer_john["name"],
+            "status": "open",
+            "createdAt": now,
+            "applicants": 1
+        },
+        {
+            "title": "Furniture Repair Assistant",
+            "description": "Need someone to help repair village furniture. Must have basic woodworking skills.",
+            "location": "East Village",
+            "category": "Carpentry",
+            "requiredSkills": ["construction", "crafting"],
+            "payment": "70 coins per day",
+            "duration": "5 days",
+            "providerId": str(carpenter_mike["_id"]),
+            "providerName": carpenter_mike["name"],
+            "status": "open",
+            "createdAt": now,
+            "applicants": 2
+        },
+        {
+            "title": "Store Inventory Manager",
+            "description": "Help organize and manage store inventory. Must be detail-oriented and good with numbers.",
+            "location": "Central Village",
+            "category": "Retail",
+            "requiredSkills": ["organization", "mathematics"],
+            "payment": "60 coins per day",
+            "duration": "Ongoing",
+            "providerId": str(shopkeeper_lisa["_id"]),
+            "providerName": shopkeeper_lisa["name"],
+            "status": "open",
+            "createdAt": now,
+            "applicants": 0
+        },
+        {
+            "title": "Animal Caretaker",
+            "description": "Need someone to feed and care for farm animals while I am away.",
+            "location": "North Village",
+            "category": "Farming",
+            "requiredSkills": ["animal care", "farming"],
+            "payment": "55 coins per day",
+            "duration": "7 days",
+            "providerId": str(farmer_john["_id"]),
+            "providerName": farmer_john["name"],
+            "status": "assigned",
+            "assignedTo": str(david_lee["_id"]),
+            "createdAt": now - timedelta(days=7),
+            "applicants": 3
+        },
+        {
+            "title": "Festival Food Preparation",
+            "description": "Looking for someone to help prepare food for the upcoming village festival.",
+            "location": "Central Village",
+            "category": "Cooking",
+            "requiredSkills": ["cooking"],
+            "payment": "65 coins per day",
+            "duration": "2 days",
+            "providerId": str(shopkeeper_lisa["_id"]),
+            "providerName": shopkeeper_lisa["name"],
+            "status": "completed",
+            "assignedTo": str(sarah_johnson["_id"]),
+            "createdAt": now - timedelta(days=12),
+            "completedAt": now - timedelta(days=10),
+            "applicants": 2
+        }
+    ]
+    
+    db["jobs"].insert_many(jobs)
+    harvest_job, furniture_job, inventory_job, animal_job, festival_job = jobs
+    
+    
+    # Seed applications
+    applications = [
+        {
+            "jobId": str(harvest_job["_id"]),
+            "seekerId": str(david_lee["_id"]),
+            "seekerName": david_lee["name"],
+            "status": "pending",
+            "appliedAt": now - timedelta(hours=2),
+            "seekerProfile": {
+                "skills": david_lee["skills"],
+                "rating": david_lee["rating"],
+                "experience": david_lee["bio"]
+            }
+        },
+        {
+            "jobId": str(furniture_job["_id"]),
+            "seekerId": str(tom_smith["_id"]),
+            "seekerName": tom_smith["name"],
+            "status": "pending",
+            "appliedAt": now - timedelta(hours=1),
+            "seekerProfile": {
+                "skills": tom_smith["skills"],
+                "rating": tom_smith["rating"],
+                "experience": tom_smith["bio"]
+            }
+        },
+        {
+            "jobId": str(furniture_job["_id"]),
+            "seekerId": str(sarah_johnson["_id"]),
+            "seekerName": sarah_johnson["name"],
+            "status": "pending",
+            "appliedAt": now - timedelta(minutes=30),
+            "seekerProfile": {
+                "skills": sarah_johnson["skills"],
+                "rating": sarah_johnson["rating"],
+                "experience": sarah_johnson["bio"]
+            }
+        },
+        {
+            "jobId": str(animal_job["_id"]),
+            "seekerId": str(david_lee["_id"]),
+            "seekerName": david_lee["name"],
+            "status": "selected",
+            "appliedAt": now - timedelta(days=8),
+            "seekerProfile": {
+                "skills": david_lee["skills"],
+                "rating": david_lee["rating"],
+                "experience": david_lee["bio"]
+            }
+        },
+        {
+            "jobId": str(festival_job["_id"]),
+            "seekerId": str(sarah_johnson["_id"]),
+            "seekerName": sarah_johnson["name"],
+            "status": "completed",
+            "appliedAt": now - timedelta(days=13),
+            "seekerProfile": {
+                "skills": sarah_johnson["skills"],
+                "rating": sarah_johnson["rating"],
+                "experience": sarah_johnson["bio"]
+            },
+            "feedback": {
+                "rating": 5,
+                "comment": "Sarah did an excellent job with the festival food preparation. Everyone loved it!"
+            }
+        }
+    ]
+    
+    db["applications"].insert_many(applications)
+    
+    # Seed notifications
+    notifications = [
+        {
+            "userId": str(farmer_john["_id"]),
+            "type": "new-application",
+            "title": "New Application",
+            "message": f"{david_lee['name']} has applied for your job: {harvest_job['title']}",
+            "read": False,
+            "timestamp": now - timedelta(hours=2)
+        },
+        {
+            "userId": str(carpenter_mike["_id"]),
+            "type": "new-application",
+            "title": "New Application",
+            "message": f"{tom_smith['name']} has applied for your job: {furniture_job['title']}",
+            "read": True,
+            "timestamp": now - timedelta(hours=1)
+        },
+        {
+            "userId": str(carpenter_mike["_id"]),
+            "type": "new-application",
+            "title": "New Application",
+            "message": f"{sarah_johnson['name']} has applied for your job: {furniture_job['title']}",
+            "read": False,
+            "timestamp": now - timedelta(minutes=30)
+        },
+        {
+            "userId": str(david_lee["_id"]),
+            "type": "job-selected",
+            "title": "Job Offer",
+            "message": f"You've been selected for the job: {animal_job['title']}",
+            "read": True,
+            "timestamp": now - timedelta(days=7)
+        },
+        {
+            "userId": str(sarah_johnson["_id"]),
+            "type": "job-feedback",
+            "title": "Job Feedback",
+            "message": f"You received a 5-star rating for the job: {festival_job['title']}. Feedback: Sarah did an excellent job with the festival food preparation. Everyone loved it!",
+            "read": False,
+            "timestamp": now - timedelta(days=10)
+        },
+        {
+            "userId": str(tom_smith["_id"]),
+            "type": "new-matching-job",
+            "title": "New Job Match",
+            "message": f"A new job matching your skills has been posted: {harvest_job['title']}",
+            "read": False,
+            "timestamp": now - timedelta(days=1)
+        }
+    ]
+    
+    db["notifications"].insert_many(notifications)
+
+
+def zipf_weights(n, skew):
+    # Probability of the i-th most popular item falls off as 1 / i^skew
+    weights = 1.0 / np.arange(1, n + 1) ** skew
+    return weights / weights.sum()
+
+
+def insert_batches(collection, documents, batch_size, executor=None, max_pending=8):
+    # Insert unordered batches, spreading them across the executor's threads when given
+    pending = []
+    inserted = 0
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) < batch_size:
+            continue
+        if executor is None:
+            collection.insert_many(batch, ordered=False)
+        else:
+            pending.append(executor.submit(collection.insert_many, batch, ordered=False))
+            # Bound the number of generated batches waiting on the database
+            if len(pending) >= max_pending:
+                pending.pop(0).result()
+        inserted += len(batch)
+        batch = []
+    if batch:
+        collection.insert_many(batch, ordered=False)
+        inserted += len(batch)
+    for future in pending:
+        future.result()
+    return inserted
+
+
+def generate_synthetic_data(
+    db,
+    users=1000,
+    jobs=500,
+    applications=5000,
+    notifications=10000,
+    provider_ratio=0.2,
+    skills_per_seeker=3,
+    skill_skew=1.0,
+    location_skew=0.5,
+    days=90,
+    batch_size=5000,
+    workers=4,
+    password=DEFAULT_PASSWORD,
+    seed=None,
+):
+    """Insert a realistic, internally consistent synthetic dataset and return the counts inserted."""
+    if users <= 0 and (jobs or applications or notifications):
+        # Jobs need a provider and notifications a recipient
+        raise ValueError("jobs, applications and notifications need at least one user")
+    rng = np.random.default_rng(seed)
+    now = datetime.utcnow()
+    span = days * 86400.0
+
+    # Every synthetic user shares one password, so bcrypt runs exactly once
+    password_hash = get_password_hash(password)
+
+    skill_probabilities = zipf_weights(len(SKILLS), skill_skew)
+    location_probabilities = zipf_weights(len(LOCATIONS), location_skew)
+
+    # Users: ids are pre-assigned so jobs and applications can reference them without re-querying
+    provider_count = max(1, int(users * provider_ratio)) if users else 0
+    seeker_count = users - provider_count
+    user_ids = [ObjectId() for _ in range(users)]
+    user_names = [
+        f"{FIRST_NAMES[first]} {LAST_NAMES[last]} {index}"
+        for index, (first, last) in enumerate(zip(
+            rng.integers(0, len(FIRST_NAMES), users), rng.integers(0, len(LAST_NAMES), users)
+        ))
+    ]
+    user_locations = rng.choice(len(LOCATIONS), users, p=location_probabilities)
+    user_ratings = np.round(rng.uniform(3.0, 5.0, users), 1)
+    seeker_skills = [
+        rng.choice(len(SKILLS), min(skills_per_seeker, len(SKILLS)), replace=False, p=skill_probabilities)
+        for _ in range(seeker_count)
+    ]
+
+    def user_documents():
+        for index in range(users):
+            is_provider = index < provider_count
+            document = {
+                "_id": user_ids[index],
+                "name": user_names[index],
+                "email": f"user{index}@synthetic.village.com",
+                "password": password_hash,
+                "userType": "provider" if is_provider else "seeker",
+                "location": LOCATIONS[user_locations[index]],
+                "phone": f"555-{index // 10000:03d}-{index % 10000:04d}",
+                "rating": float(user_ratings[index]),
+                "bio": "Synthetic load-testing user.",
+                "createdAt": now - timedelta(seconds=float(rng.uniform(0, span))),
+            }
+            if not is_provider:
+                document["skills"] = [SKILLS[skill] for skill in seeker_skills[index - provider_count]]
+            yield document
+
+    # Applications: unique (job, seeker) pairs, with popular jobs drawing more applicants
+    if jobs and seeker_count and applications:
+        job_popularity = zipf_weights(jobs, 0.8)[rng.permutation(jobs)]
+        pairs = np.unique(
+            rng.choice(jobs, applications, p=job_popularity).astype(np.int64) * seeker_count
+            + rng.integers(0, seeker_count, applications)
+        )
+        application_jobs = pairs // seeker_count
+        application_seekers = pairs % seeker_count
+    else:
+        application_jobs = np.zeros(0, dtype=np.int64)
+        application_seekers = np.zeros(0, dtype=np.int64)
+    applicant_counts = np.bincount(application_jobs, minlength=jobs)
+    # pairs are sorted by job, so each job's first application is the one that gets selected
+    first_application = np.full(jobs, -1, dtype=np.int64)
+    if len(application_jobs):
+        job_starts = np.flatnonzero(np.r_[True, application_jobs[1:] != application_jobs[:-1]])
+        first_application[application_jobs[job_starts]] = job_starts
+
+    # Jobs: status depends on whether anyone applied
+    job_ids = [ObjectId() for _ in range(jobs)]
+    job_providers = rng.integers(0, max(provider_count, 1), jobs)
+    job_statuses = np.where(
+        applicant_counts > 0,
+        rng.choice(3, jobs, p=[0.5, 0.3, 0.2]),
+        0
+    )
+    job_ages = rng.uniform(0, span, jobs)
+    # Open jobs expire over the coming weeks, so a first expiry sweep has nothing to close
+    job_expiry_days = rng.uniform(1, JOB_TTL_DAYS, jobs)
+    job_skills = [
+        rng.choice(len(SKILLS), int(rng.integers(1, 4)), replace=False, p=skill_probabilities)
+        for _ in range(jobs)
+    ]
+    status_names = ["open", "assigned", "completed"]
+
+    def job_documents():
+        for index in range(jobs):
+            provider = int(job_providers[index])
+            skills = [SKILLS[skill] for skill in job_skills[index]]
+            category = SKILL_CATEGORIES.get(skills[0], "General")
+            created = now - timedelta(seconds=float(job_ages[index]))
+            document = {
+                "_id": job_ids[index],
+                "title": f"{category} help needed #{index}",
+                "description": f"Looking for help with {', '.join(skills)}.",
+                "location": LOCATIONS[user_locations[provider]],
+                "category": category,
+                "requiredSkills": skills,
+                "payment": f"{int(rng.integers(30, 120))} coins per day",
+                "duration": f"{int(rng.integers(1, 15))} days",
+                "providerId": str(user_ids[provider]),
+                "providerName": user_names[provider],
+                "status": status_names[job_statuses[index]],
+                "createdAt": created,
+                "applicants": int(applicant_counts[index]),
+            }
+            if job_statuses[index] == 0:
+                document["expiresAt"] = now + timedelta(days=float(job_expiry_days[index]))
+            else:
+                document["expiresAt"] = created + timedelta(days=JOB_TTL_DAYS)
+            if job_statuses[index] > 0:
+                seeker = provider_count + int(application_seekers[first_application[index]])
+                document["assignedTo"] = str(user_ids[seeker])
+            if job_statuses[index] == 2:
+                document["completedAt"] = created + (now - created) / 2
+            yield document
+
+    def application_documents():
+        for index in range(len(application_jobs)):
+            job = int(application_jobs[index])
+            seeker = provider_count + int(application_seekers[index])
+            job_status = job_statuses[job]
+            selected = first_application[job] == index
+            if job_status == 0:
+                application_status = "pending"
+            elif not selected:
+                application_status = "rejected"
+            else:
+                application_status = "selected" if job_status == 1 else "completed"
+            document = {
+                "jobId": str(job_ids[job]),
+                "seekerId": str(user_ids[seeker]),
+                "seekerName": user_names[seeker],
+                "status": application_status,
+                "appliedAt": now - timedelta(seconds=float(rng.uniform(0, job_ages[job]))),
+                "seekerProfile": {
+                    "skills": [SKILLS[skill] for skill in seeker_skills[seeker - provider_count]],
+                    "rating": float(user_ratings[seeker]),
+                    "experience": "Synthetic load-testing user.",
+                },
+            }
+            if application_status == "completed":
+                document["feedback"] = {"rating": int(rng.integers(3, 6)), "comment": "Good work."}
+            yield document
+
+    def notification_documents():
+        types = rng.integers(0, len(NOTIFICATION_TYPES), notifications)
+        recipients = rng.integers(0, max(users, 1), notifications)
+        read = rng.random(notifications) < 0.5
+        ages = rng.uniform(0, span, notifications)
+        for index in range(notifications):
+            yield {
+                "userId": str(user_ids[recipients[index]]),
+                "type": NOTIFICATION_TYPES[types[index]],
+                "title": "Synthetic Notification",
+                "message": "Synthetic load-testing notification.",
+                "read": bool(read[index]),
+                "timestamp": now - timedelta(seconds=float(ages[index])),
+            }
+
+    counts = {}
+    with ThreadPoolExecutor(max_workers=workers) if workers > 1 else _NoExecutor() as executor:
+        counts["users"] = insert_batches(db["users"], user_documents(), batch_size, executor)
+        counts["jobs"] = insert_batches(db["jobs"], job_documents(), batch_size, executor)
+        counts["applications"] = insert_batches(db["applications"], application_documents(), batch_size, executor)
+        if users:
+            counts["notifications"] = insert_batches(
+                db["notifications"], notification_documents(), batch_size, executor
+            )
+    return counts
+
+
+class _NoExecutor:
+    # Stands in for a thread pool when inserting from a single thread
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load synthetic Village Jobs data for load testing")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=500)
+    parser.add_argument("--applications", type=int, default=5000)
+    parser.add_argument("--notifications", type=int, default=10000)
+    parser.add_argument("--provider-ratio", type=float, default=0.2)
+    parser.add_argument("--skills-per-seeker", type=int, default=3)
+    parser.add_argument("--skill-skew", type=float, default=1.0, help="Zipf exponent of skill popularity")
+    parser.add_argument("--location-skew", type=float, default=0.5, help="Zipf exponent of location popularity")
+    parser.add_argument("--days", type=int, default=90, help="Spread timestamps over this many days")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4, help="Threads inserting batches concurrently")
+    parser.add_argument("--seed", type=int, help="Random seed for reproducible data")
+    parser.add_argument("--drop", action="store_true", help="Drop existing collections first")
+    args = parser.parse_args(argv)
+    # Checked before connecting so --drop never runs for an invalid request
+    if args.users <= 0 and (args.jobs or args.applications or args.notifications):
+        parser.error("--jobs, --applications and --notifications need --users of at least 1")
+
+    from dotenv import load_dotenv
+    from pymongo import MongoClient
+
+    load_dotenv()
+    client = MongoClient(os.getenv("MONGO_URI", "mongodb://localhost:27017"))
+    db = client["village_jobs"]
+    try:
+        if args.drop:
+            for name in ("users", "jobs", "applications", "notifications"):
+                db.drop_collection(name)
+        started = time.perf_counter()
+        counts = generate_synthetic_data(
+            db,
+            users=args.users,
+            jobs=args.jobs,
+            applications=args.applications,
+            notifications=args.notifications,
+            provider_ratio=args.provider_ratio,
+            skills_per_seeker=args.skills_per_seeker,
+            skill_skew=args.skill_skew,
+            location_skew=args.location_skew,
+            days=args.days,
+            batch_size=args.batch_size,
+            workers=args.workers,
+            seed=args.seed,
+        )
+        elapsed = time.perf_counter() - started
+        total = sum(counts.values())
+        for name, count in counts.items():
+            print(f"{name}: {count}")
+        print(f"Inserted {total} documents in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.0f} docs/s)")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Per-route flame summary of spans exported by tracing.FileExporter.
+
+Groups traces by root span (one per route template) and prints latency
+percentiles plus the aggregated span tree, with self time and calls per
+request for each child:
+
+    python trace_summary.py traces.ndjson --route "GET /jobs"
+"""
+import argparse
+import json
+import sys
+from collections import defaultdict
+
+
+def load_traces(path):
+    traces = defaultdict(list)
+    with open(path, encoding="utf-8") as lines:
+        for line in lines:
+            line = line.strip()
+            if line:
+                span = json.loads(line)
+                traces[span["traceId"]].append(span)
+    return traces
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class FlameNode:
+    def __init__(self, name):
+        self.name = name
+        self.total_ms = 0.0
+        self.self_ms = 0.0
+        self.calls = 0
+        self.children = {}
+
+    def child(self, name):
+        if name not in self.children:
+            self.children[name] = FlameNode(name)
+        return self.children[name]
+
+
+def merge(node, span, children_of):
+    children = children_of.get(span["spanId"], [])
+    duration = span["durationMs"] or 0.0
+    node.calls += 1
+    node.total_ms += duration
+    node.self_ms += max(0.0, duration - sum(child["durationMs"] or 0.0 for child in children))
+    for child in children:
+        merge(node.child(child["name"]), child, children_of)
+
+
+def summarize(traces):
+    routes = {}
+    for spans in traces.values():
+        root = next((span for span in spans if span["parentId"] is None), None)
+        if root is None:
+            continue
+        children_of = defaultdict(list)
+        for span in spans:
+            if span["parentId"] is not None:
+                children_of[span["parentId"]].append(span)
+        route = routes.setdefault(root["name"], {"durations": [], "errors": 0, "tree": FlameNode(root["name"])})
+        route["durations"].append(root["durationMs"] or 0.0)
+        route["errors"] += any(span["error"] for span in spans) or root["attributes"].get("http.status", 200) >= 500
+        merge(route["tree"], root, children_of)
+    return routes
+
+
+def render(node, requests, root_total, depth=0, width=30):
+    share = node.total_ms / root_total if root_total else 0.0
+    bar = "#" * min(width, round(share * width))
+    print(
+        f"  {'  ' * depth + node.name:<44}{bar:<{width}} {share:>6.1%}"
+        f"{node.total_ms / requests:>10.2f}{node.self_ms / requests:>10.2f}{node.calls / requests:>8.1f}"
+    )
+    for child in sorted(node.children.values(), key=lambda child: -child.total_ms):
+        render(child, requests, root_total, depth + 1, width)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize exported request traces per route")
+    parser.add_argument("path", nargs="?", default="traces.ndjson")
+    parser.add_argument("--route", help="Only show this route, e.g. \"GET /jobs\"")
+    args = parser.parse_args(argv)
+
+    routes = summarize(load_traces(args.path))
+    if args.route:
+        routes = {name: route for name, route in routes.items() if name == args.route}
+    if not routes:
+        print("No traces found", file=sys.stderr)
+        return 1
+
+    for name, route in sorted(routes.items(), key=lambda item: -sum(item[1]["durations"])):
+        durations = route["durations"]
+        print(
+            f"{name}  requests={len(durations)} errors={route['errors']}"
+            f"  p50={percentile(durations, 0.5):.2f}ms p95={percentile(durations, 0.95):.2f}ms"
+        )
+        print(f"  {'span':<44}{'':<30} {'share':>6}{'ms/req':>10}{'self/req':>10}{'calls':>8}")
+        render(route["tree"], len(durations), route["tree"].total_ms)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
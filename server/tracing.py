@@ -0,0 +1,203 @@
+"""Lightweight request tracing with local span export.
+
+A sampled request gets a root span named after its route. MongoDB commands,
+bcrypt calls and explicit serialization steps made while handling it become
+child spans. Finished traces are written as one JSON span per line to
+TRACE_FILE, or summarized on stderr, with no collector service involved:
+
+    TRACE_SAMPLE_RATE=0.1 TRACE_EXPORTER=file TRACE_FILE=traces.ndjson python app.py
+    python trace_summary.py traces.ndjson
+"""
+import json
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from pymongo import monitoring
+
+current_span = ContextVar("current_span", default=None)
+
+
+def new_id(bits=64):
+    return f"{random.getrandbits(bits):0{bits // 4}x}"
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "start", "duration_ms", "attributes", "error", "spans")
+
+    def __init__(self, name, parent=None, attributes=None):
+        self.trace_id = parent.trace_id if parent else new_id(128)
+        self.span_id = new_id()
+        self.parent_id = parent.span_id if parent else None
+        self.name = name
+        self.start = time.time()
+        self.duration_ms = None
+        self.attributes = dict(attributes or {})
+        self.error = None
+        # Every span of a trace is collected on the root's list
+        self.spans = parent.spans if parent else []
+        self.spans.append(self)
+
+    def finish(self, duration_ms=None):
+        if self.duration_ms is None:
+            self.duration_ms = duration_ms if duration_ms is not None else (time.time() - self.start) * 1000
+
+    def to_dict(self):
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentId": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "durationMs": self.duration_ms,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class FileExporter:
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def export(self, spans):
+        lines = "".join(json.dumps(span.to_dict(), default=str) + "\n" for span in spans)
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as output:
+                output.write(lines)
+
+
+class ConsoleExporter:
+    def export(self, spans):
+        root = spans[0]
+        children = {}
+        for span in spans[1:]:
+            children[span.name] = children.get(span.name, 0.0) + (span.duration_ms or 0.0)
+        breakdown = ", ".join(f"{name} {ms:.1f}ms" for name, ms in sorted(children.items(), key=lambda item: -item[1]))
+        print(f"[trace {root.trace_id[:8]}] {root.name} {root.duration_ms:.1f}ms {breakdown}", file=sys.stderr)
+
+
+class Tracer:
+    def __init__(self, sample_rate=0.0, exporter=None):
+        self.sample_rate = sample_rate
+        self.exporter = exporter
+
+    @classmethod
+    def from_env(cls):
+        sample_rate = float(os.getenv("TRACE_SAMPLE_RATE", "0"))
+        if os.getenv("TRACE_EXPORTER", "file") == "console":
+            exporter = ConsoleExporter()
+        else:
+            exporter = FileExporter(os.getenv("TRACE_FILE", "traces.ndjson"))
+        return cls(sample_rate, exporter)
+
+    @property
+    def enabled(self):
+        return self.sample_rate > 0 and self.exporter is not None
+
+    def start_trace(self, name, attributes=None):
+        # Returns the root span, or None when this request is not sampled
+        if not self.enabled or random.random() >= self.sample_rate:
+            return None
+        return Span(name, attributes=attributes)
+
+    def finish_trace(self, root):
+        root.finish()
+        try:
+            self.exporter.export(root.spans)
+        except OSError:
+            pass
+
+    def start_span(self, name, attributes=None):
+        # Child of the current span without becoming current itself; None outside a sampled trace
+        parent = current_span.get()
+        return Span(name, parent, attributes) if parent is not None else None
+
+    @contextmanager
+    def span(self, name, **attributes):
+        parent = current_span.get()
+        if parent is None:
+            yield None
+            return
+        span = Span(name, parent, attributes)
+        token = current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = repr(e)
+            raise
+        finally:
+            current_span.reset(token)
+            span.finish()
+
+
+class MongoCommandTracer(monitoring.CommandListener):
+    """Records each MongoDB command issued inside a sampled request as a child span."""
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+        self.pending = {}
+
+    def started(self, event):
+        collection = event.command.get(event.command_name)
+        span = self.tracer.start_span(
+            f"mongo.{event.command_name}",
+            {"db": event.database_name, "collection": collection if isinstance(collection, str) else None}
+        )
+        if span is not None:
+            self.pending[(event.request_id, event.connection_id)] = span
+
+    def succeeded(self, event):
+        span = self.pending.pop((event.request_id, event.connection_id), None)
+        if span is not None:
+            span.finish(event.duration_micros / 1000)
+
+    def failed(self, event):
+        span = self.pending.pop((event.request_id, event.connection_id), None)
+        if span is not None:
+            span.error = str(event.failure)
+            span.finish(event.duration_micros / 1000)
+
+
+class TracingMiddleware:
+    def __init__(self, app, tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        root = self.tracer.start_trace(
+            f"{scope['method']} {scope['path']}",
+            {"http.method": scope["method"], "http.path": scope["path"]}
+        )
+        if root is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def traced_send(message):
+            if message["type"] == "http.response.start":
+                root.attributes["http.status"] = message["status"]
+            await send(message)
+
+        token = current_span.set(root)
+        try:
+            await self.app(scope, receive, traced_send)
+        except BaseException as e:
+            root.error = repr(e)
+            raise
+        finally:
+            current_span.reset(token)
+            # Name the trace after the route template so requests group per route
+            route = scope.get("route")
+            if route is not None and hasattr(route, "path"):
+                root.name = f"{scope['method']} {route.path}"
+            self.tracer.finish_trace(root)
+
+
+tracer = Tracer.from_env()